@@ -7,7 +7,7 @@ spec compliance, Amazon integrations, and property testing frameworks.
 
 import logging
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 import asyncio
 import json
@@ -331,8 +331,8 @@ class ModernizationEngine:
         
         # Store design data
         design = {
-            'properties': [prop.__dict__ for prop in properties],
-            'tasks': [task.__dict__ for task in task_list.tasks],
+            'properties': [asdict(prop) for prop in properties],
+            'tasks': [asdict(task) for task in task_list.tasks],
             'components': design_data['components']
         }
         
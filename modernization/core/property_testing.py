@@ -7,8 +7,10 @@ providing generators for audio data and test strategies for VTT components.
 
 import logging
 from typing import Dict, List, Any, Optional, Callable, Union
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+import itertools
 import numpy as np
 from hypothesis import given, strategies as st, settings, Verbosity
 from hypothesis.extra.numpy import arrays
@@ -16,6 +18,29 @@ import pytest
 
 logger = logging.getLogger(__name__)
 
+# Hypothesis profiles shared by every framework instance, registered once at import
+_DEFAULT_PROFILE = "vtt_framework"
+_VERBOSE_PROFILE = "vtt_framework_verbose"
+
+settings.register_profile(_DEFAULT_PROFILE,
+    max_examples=100,
+    deadline=10000,  # 10 seconds
+    verbosity=Verbosity.normal
+)
+
+settings.register_profile(_VERBOSE_PROFILE,
+    max_examples=100,
+    deadline=10000,  # 10 seconds
+    verbosity=Verbosity.verbose
+)
+
+# Immutable scalars whose round-trip outcome depends only on their repr
+_ROUND_TRIP_CACHEABLE_TYPES = (bool, int, float, str)
+_ROUND_TRIP_MAX_REPR_LENGTH = 128
+
+# Sine signals kept per generator set (least recently used evicted first)
+_SIGNAL_POOL_SIZE = 8
+
 
 class PropertyType(Enum):
     """Types of properties for testing."""
@@ -74,15 +99,30 @@ class AudioGeneratorSet:
     
     def __init__(self, config: AudioGeneratorConfig):
         self.config = config
+        # Read-only sine signals, keyed by (sample_rate, duration)
+        self._signal_pool: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        # Grow-only scratch buffer for noise, reused across draws
+        self._noise_scratch = np.empty(0, dtype=np.float64)
         
     def valid_audio(self) -> st.SearchStrategy:
-        """Generate valid audio data arrays."""
-        return st.builds(
-            self._create_audio_array,
-            sample_rate=st.sampled_from(self.config.sample_rates),
-            duration=st.sampled_from(self.config.durations),
-            channels=st.sampled_from(self.config.channels),
-            noise_level=st.sampled_from(self.config.noise_levels)
+        """
+        Generate valid audio data arrays.
+        
+        Draws an index into the parameter combinations, so shrinking only
+        walks towards index 0 (the smallest configured values), and a noise
+        seed, so failing examples replay with the same noise.
+        """
+        combinations = list(itertools.product(
+            self.config.sample_rates,
+            self.config.durations,
+            self.config.channels,
+            self.config.noise_levels
+        ))
+        return st.tuples(
+            st.integers(0, len(combinations) - 1),
+            st.integers(0, 2**32 - 1)
+        ).map(
+            lambda drawn: self._create_audio_array(*combinations[drawn[0]], seed=drawn[1])
         )
     
     def invalid_audio(self) -> st.SearchStrategy:
@@ -103,26 +143,52 @@ class AudioGeneratorSet:
             self._very_long_audio()
         ])
     
-    def _create_audio_array(self, sample_rate: int, duration: float, 
-                           channels: int, noise_level: float) -> np.ndarray:
-        """Create a synthetic audio array."""
-        num_samples = int(sample_rate * duration)
+    def _sine_signal(self, sample_rate: int, duration: float) -> np.ndarray:
+        """Return the pooled read-only sine signal for the given rate and duration."""
+        key = (sample_rate, duration)
+        signal = self._signal_pool.get(key)
+        if signal is not None:
+            self._signal_pool.move_to_end(key)
+            return signal
         
-        # Generate base signal (sine wave)
+        num_samples = int(sample_rate * duration)
         t = np.linspace(0, duration, num_samples)
         frequency = 440.0  # A4 note
         signal = np.sin(2 * np.pi * frequency * t)
+        signal.flags.writeable = False
+        
+        if len(self._signal_pool) >= _SIGNAL_POOL_SIZE:
+            self._signal_pool.popitem(last=False)
+        self._signal_pool[key] = signal
+        return signal
+    
+    def _create_audio_array(self, sample_rate: int, duration: float, 
+                           channels: int, noise_level: float,
+                           seed: Optional[int] = None) -> np.ndarray:
+        """Create a synthetic audio array, with noise drawn from ``seed``."""
+        # Base signal (sine wave), shared with earlier draws
+        signal = self._sine_signal(sample_rate, duration)
         
-        # Add noise
+        num_samples = signal.shape[0]
+        mono = np.empty(num_samples, dtype=np.float32)
+        
+        # Add noise drawn into the scratch buffer, the pooled signal is left untouched
         if noise_level > 0:
-            noise = np.random.normal(0, noise_level, num_samples)
-            signal += noise
+            if self._noise_scratch.shape[0] < num_samples:
+                self._noise_scratch = np.empty(num_samples, dtype=np.float64)
+            noise = self._noise_scratch[:num_samples]
+            rng = np.random.default_rng(seed)
+            rng.standard_normal(out=noise)
+            noise *= noise_level
+            np.add(signal, noise, out=mono, casting='same_kind')
+        else:
+            mono[...] = signal
         
         # Handle channels
         if channels == 1:
-            return signal.astype(np.float32)
+            return mono
         else:
-            return np.tile(signal, (channels, 1)).T.astype(np.float32)
+            return np.tile(mono, (channels, 1)).T
     
     def _silent_audio(self) -> st.SearchStrategy:
         """Generate silent audio."""
@@ -191,12 +257,14 @@ class PropertyTestFramework:
         self.audio_generators = AudioGeneratorSet(self.audio_generator_config)
         self.properties: List[TranscriptionProperty] = []
         
-        # Configure Hypothesis settings
-        self.hypothesis_settings = settings(
-            max_examples=self.config.get('max_examples', 100),
-            verbosity=Verbosity.verbose if self.config.get('verbose', False) else Verbosity.normal,
-            deadline=self.config.get('deadline', 10000)  # 10 seconds
+        # Configure Hypothesis settings from the shared profiles; only explicit
+        # overrides pay for building a new settings object
+        profile = settings.get_profile(
+            _VERBOSE_PROFILE if self.config.get('verbose', False) else _DEFAULT_PROFILE
         )
+        overrides = {key: self.config[key] for key in ('max_examples', 'deadline')
+                     if key in self.config}
+        self.hypothesis_settings = settings(profile, **overrides) if overrides else profile
         
         logger.info("Property Test Framework initialized")
     
@@ -231,10 +299,51 @@ class PropertyTestFramework:
         
         return properties
     
+    def property_params(self) -> List[Any]:
+        """
+        Expose the defined properties as pytest parameters.
+        
+        Use with ``@pytest.mark.parametrize("prop", framework.property_params())``
+        so each property becomes its own test case, which pytest-xdist
+        (``pytest -n auto``) can distribute across cores.
+        
+        Returns:
+            List of pytest parameters identified by property name
+        """
+        return [pytest.param(prop, id=prop.name) for prop in self.properties]
+    
+    def run_single_property(self, prop: TranscriptionProperty, component: Any) -> Optional[Dict[str, Any]]:
+        """
+        Run a single property test on a component.
+        
+        Args:
+            prop: Property to execute
+            component: Component to test
+            
+        Returns:
+            Failure information, or None if the property held
+        """
+        try:
+            prop.test_function(component)
+            logger.debug(f"Property test passed: {prop.name}")
+            return None
+        except Exception as e:
+            logger.warning(f"Property test failed: {prop.name} - {str(e)}")
+            return {
+                'property': prop.name,
+                'error': str(e),
+                'requirements_ref': prop.requirements_reference
+            }
+    
     def run_property_tests(self, component: Any, iterations: int = 100) -> TestResults:
         """
         Run property tests on a component.
         
+        Properties run serially in this process; their test functions are
+        closures over the framework and cannot be shipped to worker processes.
+        For parallel execution, parametrize a pytest test with
+        ``property_params()`` and run it under pytest-xdist.
+        
         Args:
             component: Component to test
             iterations: Number of test iterations
@@ -247,36 +356,20 @@ class PropertyTestFramework:
         import time
         start_time = time.time()
         
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        failures = []
+        # Property closures read self.hypothesis_settings when they run
+        base_settings = self.hypothesis_settings
+        self.hypothesis_settings = settings(base_settings, max_examples=iterations)
         
         try:
-            # Run each property test
-            for prop in self.properties:
-                try:
-                    # Configure Hypothesis for this test
-                    test_settings = settings(max_examples=iterations)
-                    
-                    # Execute property test
-                    with test_settings:
-                        prop.test_function(component)
-                    
-                    total_tests += 1
-                    passed_tests += 1
-                    logger.debug(f"Property test passed: {prop.name}")
-                    
-                except Exception as e:
-                    total_tests += 1
-                    failed_tests += 1
-                    failure_info = {
-                        'property': prop.name,
-                        'error': str(e),
-                        'requirements_ref': prop.requirements_reference
-                    }
-                    failures.append(failure_info)
-                    logger.warning(f"Property test failed: {prop.name} - {str(e)}")
+            failures = [
+                failure for failure in (
+                    self.run_single_property(prop, component) for prop in self.properties
+                )
+                if failure is not None
+            ]
+            total_tests = len(self.properties)
+            failed_tests = len(failures)
+            passed_tests = total_tests - failed_tests
             
             end_time = time.time()
             execution_time = end_time - start_time
@@ -308,6 +401,8 @@ class PropertyTestFramework:
                 execution_time=0.0,
                 coverage_metrics={}
             )
+        finally:
+            self.hypothesis_settings = base_settings
     
     def validate_round_trip_properties(self, serializer: Serializer) -> bool:
         """
@@ -321,14 +416,28 @@ class PropertyTestFramework:
         """
         logger.debug("Validating round-trip properties")
         
+        # Small scalars already proven to round-trip skip the serializer on replay
+        verified = set()
+        
         try:
             @given(data=st.text() | st.integers() | st.floats(allow_nan=False))
             @self.hypothesis_settings
             def test_round_trip(data):
                 """Test that serialize -> deserialize returns original data."""
+                cache_key = None
+                if type(data) in _ROUND_TRIP_CACHEABLE_TYPES:
+                    data_repr = repr(data)
+                    if len(data_repr) < _ROUND_TRIP_MAX_REPR_LENGTH:
+                        cache_key = (type(data), data_repr)
+                        if cache_key in verified:
+                            return
+                
                 serialized = serializer.serialize(data)
                 deserialized = serializer.deserialize(serialized)
                 assert deserialized == data, f"Round-trip failed: {data} != {deserialized}"
+                
+                if cache_key is not None:
+                    verified.add(cache_key)
             
             # Run the test
             test_round_trip()
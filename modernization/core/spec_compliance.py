@@ -6,16 +6,218 @@ including EARS patterns, INCOSE quality rules, and requirements traceability.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Mapping, NamedTuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 import re
 import json
+import hashlib
+import html
+import io
+import os
+import sys
+import time
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+from operator import attrgetter
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator, the stdlib json module is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of validation results memoized per module instance
+VALIDATION_CACHE_SIZE = 128
+
+# Seconds during which generated documents share the same timestamp strings
+TIMESTAMP_CACHE_SECONDS = 1.0
+
+# Smallest requirement set split across processes when parallel checks are enabled
+PARALLEL_CHECK_MIN_REQUIREMENTS = 1000
+
+# System entity and its action verb, e.g. "THE VTT_System SHALL start"
+_ENTITY_ACTION_RE = re.compile(r'THE\s+(\w+)\s+SHALL(?:\s+(\w+))?', re.IGNORECASE)
+
+# Acceptance criteria shorter than this (after stripping) are flagged as too brief
+_BRIEF_CRITERION_LENGTH = 10
+
+# Leading EARS keyword, applied with match() so it is anchored at the start
+_EARS_PREFIX_RE = re.compile(r'THE|WHEN|IF|WHILE|WHERE', re.IGNORECASE)
+
+# Any digit; a single character is enough for a presence check
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# Relative weight of each task effort level; unknown levels weigh as 'Medium'
+_EFFORT_WEIGHTS = MappingProxyType({'Small': 1, 'Medium': 3, 'Large': 5})
+_DEFAULT_EFFORT_WEIGHT = 3
+
+# Shared instances of recurring vocabulary, so equal values from input data are one object
+_EFFORT_LEVELS = MappingProxyType({level: sys.intern(level) for level in _EFFORT_WEIGHTS})
+_PRIORITY_LEVELS = MappingProxyType({level: sys.intern(level) for level in ('Low', 'Medium', 'High', 'Critical')})
+
+# Fields every requirement must provide, in reporting order
+_REQUIRED_FIELDS = ('text', 'acceptance_criteria', 'user_story')
+
+# Verifiability vocabulary, matched as substrings of the lowercased criterion
+_TESTABLE_KEYWORDS = ('shall', 'must', 'should', 'will', 'can', 'verify', 'validate', 'test', 'measure')
+_CRITERION_TESTABLE_KEYWORDS = ('shall', 'must', 'should', 'will', 'can', 'verify', 'validate', 'test')
+_QUANTIFIABLE_TERMS = ('within', 'less than', 'greater than', 'at least', 'at most', 'exactly', 'between')
+_PERFORMANCE_WORDS = ('performance', 'speed', 'time', 'latency', 'throughput')
+_VAGUE_TERMS = ('appropriate', 'suitable', 'adequate', 'reasonable', 'efficient', 'user-friendly')
+
+# Words hinting at the EARS pattern a non-compliant requirement should use
+_EVENT_TRIGGER_WORDS = ('when', 'if', 'after', 'before', 'upon')
+_STATE_TRIGGER_WORDS = ('while', 'during', 'throughout')
+_OPTIONAL_TRIGGER_WORDS = ('where', 'provided', 'given')
+
+# Sentence terminators followed by whitespace, so "e.g." and "2.5" stay inside a sentence
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+
+# Sentences with more words than this are reported as overly complex
+_MAX_SENTENCE_WORDS = 25
+
+# A word, as delimited by str.split()
+_WORD_RE = re.compile(r'\S+')
+
+# Pronouns that leave the referenced entity ambiguous, as whole words
+_AMBIGUOUS_PRONOUNS = ('it', 'this', 'that', 'they', 'them')
+_AMBIGUOUS_PRONOUN_RE = re.compile(r'\b(it|this|that|they|them)\b', re.IGNORECASE)
+
+# Feasibility indicators, matched as substrings of the lowercased requirement text
+_HIGH_RISK_TERMS = ('real-time', 'instantaneous', '100%', 'never fail', 'always', 'perfect')
+_TECHNICAL_CONSTRAINTS = ('cpu', 'gpu', 'memory', 'disk', 'network', 'latency', 'throughput')
+
+# "As a <role>, I want <goal>, so that <benefit>", clauses in that order
+_USER_STORY_RE = re.compile(r'\s*As\s+an?\s+.+?\s+I\s+want\s+.+?\s+so\s+that\s+.+', re.IGNORECASE | re.DOTALL)
+
+# Marks an absent field where None is a meaningful value
+_MISSING = object()
+
+# Action verbs that conflict when required of the same entity
+_OPPOSITE_ACTIONS = MappingProxyType({
+    'start': 'stop', 'stop': 'start',
+    'enable': 'disable', 'disable': 'enable',
+    'allow': 'prevent', 'prevent': 'allow'
+})
+
+# Distinct IDs and user stories remembered by the pure formatting helpers below
+_STRING_CACHE_SIZE = 4096
+
+
+def _canonical(value: Any, levels: Mapping[str, str]) -> Any:
+    """Return the shared instance of a known vocabulary value, or the value unchanged."""
+    return levels.get(value, value) if isinstance(value, str) else value
+
+
+def _sentence_spans(text: str):
+    """Yield the (start, end) offsets of each sentence in ``text`` without slicing it."""
+    start = 0
+    for boundary in _SENTENCE_SPLIT_RE.finditer(text):
+        yield start, boundary.start()
+        start = boundary.end()
+    yield start, len(text)
+
+
+def _has_more_words(text: str, start: int, end: int, limit: int) -> bool:
+    """Check whether ``text[start:end]`` holds more than ``limit`` words, stopping early."""
+    words = _WORD_RE.finditer(text, start, end)
+    return next(islice(words, limit, None), None) is not None
+
+
+@lru_cache(maxsize=_STRING_CACHE_SIZE)
+def _sections_markdown(sections: Tuple[str, ...]) -> str:
+    """Render template section names as a Markdown bullet list."""
+    return '\n'.join(f"- {section.title()}" for section in sections)
+
+
+@lru_cache(maxsize=_STRING_CACHE_SIZE)
+def _hierarchical_id(req_id: str) -> str:
+    """Convert a flat requirement ID to hierarchical form (e.g. "req_1_2" -> "1.2")."""
+    if '_' in req_id:
+        return '.'.join(req_id.replace('req_', '').split('_'))
+    return req_id
+
+
+@lru_cache(maxsize=_STRING_CACHE_SIZE)
+def _is_user_story(user_story: str) -> bool:
+    """Check a user story against the "As a... I want... so that..." template."""
+    return _USER_STORY_RE.fullmatch(user_story) is not None
+
+
+def _html_text(value: Any) -> str:
+    """Escape a value for use as HTML text content."""
+    return html.escape(str(value), quote=False)
+
+
+# Introduction section of generated requirements documents
+_INTRODUCTION_TEMPLATE = """## Introduction
+
+This document specifies the requirements for {title}. The requirements follow modern 
+specification standards including EARS (Easy Approach to Requirements Syntax) patterns 
+and INCOSE quality guidelines.
+
+### Purpose
+
+{purpose}
+
+### Scope
+
+{scope}
+
+### Document Structure
+
+This document is organized according to the {template_name} template and includes:
+{sections}"""
+
+# Page skeleton for HTML export; the glossary and requirements are written between the parts
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
+        h1, h2, h3 {{ color: #333; }}
+        .metadata {{ background: #f5f5f5; padding: 15px; border-radius: 5px; }}
+        .requirement {{ border-left: 3px solid #007acc; padding-left: 15px; margin: 20px 0; }}
+        .acceptance-criteria {{ background: #f9f9f9; padding: 10px; border-radius: 3px; }}
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <div class="metadata">
+        <p><strong>Version:</strong> {version}</p>
+        <p><strong>Date:</strong> {date}</p>
+    </div>
+    
+    <div class="introduction">
+        {introduction}
+    </div>
+    
+    <h2>Glossary</h2>
+    <dl>
+        """
+
+_HTML_REQUIREMENTS_HEADING = """
+    </dl>
+    
+    <h2>Requirements</h2>
+    """
+
+_HTML_TAIL = """
+    
+</body>
+</html>"""
+
 
 class EARSPattern(Enum):
     """EARS (Easy Approach to Requirements Syntax) pattern types."""
@@ -27,7 +229,7 @@ class EARSPattern(Enum):
     INVALID = "invalid"  # Does not match any EARS pattern
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of requirement validation."""
     is_valid: bool
@@ -39,7 +241,7 @@ class ValidationResult:
     suggestions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Generated correctness property from requirements."""
     name: str
@@ -50,7 +252,7 @@ class Property:
     validation_criteria: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskItem:
     """Individual task in the breakdown."""
     id: str
@@ -61,7 +263,7 @@ class TaskItem:
     estimated_effort: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskList:
     """Complete task breakdown structure."""
     tasks: List[TaskItem]
@@ -69,7 +271,7 @@ class TaskList:
     estimated_duration: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RequirementsDocument:
     """Generated requirements document structure."""
     title: str
@@ -81,7 +283,7 @@ class RequirementsDocument:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentTemplate:
     """Template for requirements document generation."""
     name: str
@@ -91,6 +293,15 @@ class DocumentTemplate:
     validation_rules: List[str]
 
 
+class IncoseRule(NamedTuple):
+    """INCOSE quality rule with its validator and scoring weight."""
+    name: str
+    description: str
+    validator: Callable[[Dict[str, Any]], Dict[str, Any]]
+    weight: float = 1.0
+    critical: bool = False
+
+
 class SpecComplianceModule:
     """
     Ensures the VTT system follows modern specification standards.
@@ -105,15 +316,70 @@ class SpecComplianceModule:
         Initialize the Spec Compliance Module.
         
         Args:
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary. Set
+                ``parallel_incose_validation`` to run the INCOSE rule
+                validators on a thread pool (``incose_max_workers`` threads).
+                Set ``parallel_requirement_checks`` to split the
+                per-requirement checks of large requirement sets across a
+                process pool (``requirement_check_workers`` processes).
         """
         self.config = config or {}
-        self.ears_patterns = self._initialize_ears_patterns()
-        self.incose_rules = self._initialize_incose_rules()
-        self.document_templates = self._initialize_document_templates()
+        self._validation_cache: "OrderedDict[bytes, ValidationResult]" = OrderedDict()
+        # (requirements, _run_all_checks results) while sequential INCOSE validation is running
+        self._requirement_checks_memo: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        # (monotonic refresh time, date string, ISO timestamp) for document generation
+        self._timestamp_cache: Tuple[float, str, str] = (float('-inf'), '', '')
+        
+        self._incose_executor: Optional[ThreadPoolExecutor] = None
+        if self.config.get('parallel_incose_validation', False):
+            max_workers = self.config.get('incose_max_workers') or min(
+                len(self.incose_rules), os.cpu_count() or 1
+            )
+            self._incose_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="incose"
+            )
+        
+        # Started on the first requirement set large enough to split
+        self._check_process_pool: Optional[ProcessPoolExecutor] = None
         
         logger.info("Spec Compliance Module initialized")
     
+    @cached_property
+    def ears_patterns(self) -> List[Dict[str, Any]]:
+        """EARS pattern definitions, built on first access."""
+        return self._initialize_ears_patterns()
+    
+    @cached_property
+    def incose_rules(self) -> Tuple[IncoseRule, ...]:
+        """INCOSE quality rules, built on first access."""
+        return self._initialize_incose_rules()
+    
+    @cached_property
+    def document_templates(self) -> Dict[str, DocumentTemplate]:
+        """Document templates, built on first access."""
+        return self._initialize_document_templates()
+    
+    @cached_property
+    def _ears_matcher(self) -> Tuple[re.Pattern, Dict[str, EARSPattern]]:
+        """Fused EARS regex and group-name lookup, built on first match."""
+        return self._build_ears_union(self.ears_patterns)
+    
+    def close(self):
+        """Shut down the INCOSE validation thread pool and check process pool, if any."""
+        if self._incose_executor is not None:
+            self._incose_executor.shutdown(wait=True)
+            self._incose_executor = None
+        if self._check_process_pool is not None:
+            self._check_process_pool.shutdown(wait=True)
+            self._check_process_pool = None
+    
+    def __del__(self):
+        """Cleanup on destruction."""
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def validate_requirements(self, requirements: Dict[str, Any]) -> ValidationResult:
         """
         Validate requirements against EARS patterns and INCOSE quality rules.
@@ -126,6 +392,13 @@ class SpecComplianceModule:
         """
         logger.debug("Validating requirements: %d items", len(requirements))
         
+        # Identical requirement sets (e.g. one export per format) are validated once
+        digest = self._requirements_digest(requirements)
+        if digest is not None and digest in self._validation_cache:
+            self._validation_cache.move_to_end(digest)
+            logger.debug("Reusing cached validation result")
+            return self._copy_validation_result(self._validation_cache[digest])
+        
         errors = []
         warnings = []
         suggestions = []
@@ -162,7 +435,7 @@ class SpecComplianceModule:
             logger.info("Requirements validation completed: valid=%s, score=%.2f",
                        is_valid, quality_score)
             
-            return ValidationResult(
+            result = ValidationResult(
                 is_valid=is_valid,
                 errors=errors,
                 warnings=warnings,
@@ -172,6 +445,13 @@ class SpecComplianceModule:
                 suggestions=suggestions
             )
             
+            if digest is not None:
+                self._validation_cache[digest] = self._copy_validation_result(result)
+                if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+            
+            return result
+            
         except Exception as e:
             logger.error("Error during requirements validation: %s", e, exc_info=True)
             return ValidationResult(
@@ -184,6 +464,40 @@ class SpecComplianceModule:
                 suggestions=[]
             )
     
+    def _requirements_digest(self, requirements: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Compute a stable content digest of requirements for the validation cache.
+        
+        Returns:
+            Digest bytes, or None if the requirements cannot be serialized
+        """
+        try:
+            if orjson is not None:
+                try:
+                    payload = orjson.dumps(
+                        requirements, default=str,
+                        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                    )
+                    return hashlib.blake2b(payload, digest_size=16).digest()
+                except TypeError:
+                    pass  # e.g. integers beyond 64 bits, retried with stdlib json
+            payload = json.dumps(requirements, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    def _copy_validation_result(self, result: ValidationResult) -> ValidationResult:
+        """Copy a validation result so cached entries are not shared with callers."""
+        return ValidationResult(
+            is_valid=result.is_valid,
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            pattern_type=result.pattern_type,
+            quality_score=result.quality_score,
+            incose_compliance=dict(result.incose_compliance),
+            suggestions=list(result.suggestions)
+        )
+    
     def generate_requirements_document(self, 
                                      requirements_data: Dict[str, Any],
                                      template_name: str = "standard") -> RequirementsDocument:
@@ -208,10 +522,11 @@ class SpecComplianceModule:
             validation_result = self.validate_requirements(requirements_data)
             
             # Generate document structure
+            date_string, timestamp = self._now_strings()
             document = RequirementsDocument(
                 title=requirements_data.get('title', 'Requirements Document'),
                 version=requirements_data.get('version', '1.0.0'),
-                date=datetime.now().strftime('%Y-%m-%d'),
+                date=date_string,
                 introduction=self._generate_introduction(requirements_data, template),
                 glossary=self._generate_glossary(requirements_data),
                 requirements=self._format_requirements(requirements_data, template),
@@ -220,7 +535,7 @@ class SpecComplianceModule:
                     'validation_score': validation_result.quality_score,
                     'ears_compliance': validation_result.pattern_type is not None,
                     'incose_compliance': validation_result.incose_compliance,
-                    'generation_timestamp': datetime.now().isoformat()
+                    'generation_timestamp': timestamp
                 }
             )
             
@@ -231,6 +546,20 @@ class SpecComplianceModule:
             logger.error("Error generating requirements document: %s", e, exc_info=True)
             raise
     
+    def _now_strings(self) -> Tuple[str, str]:
+        """
+        Return the current date and ISO timestamp strings for document generation.
+        
+        Batch generations within TIMESTAMP_CACHE_SECONDS reuse the same strings.
+        """
+        refreshed_at, date_string, timestamp = self._timestamp_cache
+        current = time.monotonic()
+        if current - refreshed_at >= TIMESTAMP_CACHE_SECONDS:
+            now = datetime.now()
+            date_string, timestamp = now.strftime('%Y-%m-%d'), now.isoformat()
+            self._timestamp_cache = (current, date_string, timestamp)
+        return date_string, timestamp
+    
     def export_requirements_document(self, 
                                    document: RequirementsDocument,
                                    output_path: Path,
@@ -329,7 +658,7 @@ class SpecComplianceModule:
             total_tasks = len(tasks)
             estimated_duration = self._estimate_duration(tasks)
             
-            logger.info(f"Created task breakdown: {total_tasks} tasks, estimated {estimated_duration}")
+            logger.info("Created task breakdown: %s tasks, estimated %s", total_tasks, estimated_duration)
             
             return TaskList(
                 tasks=tasks,
@@ -338,7 +667,7 @@ class SpecComplianceModule:
             )
             
         except Exception as e:
-            logger.error(f"Error creating task breakdown: {e}", exc_info=True)
+            logger.error("Error creating task breakdown: %s", e, exc_info=True)
             return TaskList(tasks=[], total_tasks=0, estimated_duration="Unknown")
     
     def ensure_ears_compliance(self, requirement: str) -> bool:
@@ -352,16 +681,16 @@ class SpecComplianceModule:
             True if requirement follows EARS patterns
         """
         try:
-            for pattern in self.ears_patterns:
-                if pattern['regex'].match(requirement.strip()):
-                    logger.debug(f"Requirement matches EARS pattern: {pattern['type']}")
-                    return True
+            pattern_type = self._match_ears(requirement.strip())
+            if pattern_type is not None:
+                logger.debug("Requirement matches EARS pattern: %s", pattern_type)
+                return True
             
-            logger.warning(f"Requirement does not match any EARS pattern: {requirement[:50]}...")
+            logger.warning("Requirement does not match any EARS pattern: %s...", requirement[:50])
             return False
             
         except Exception as e:
-            logger.error(f"Error checking EARS compliance: {e}", exc_info=True)
+            logger.error("Error checking EARS compliance: %s", e, exc_info=True)
             return False
     
     def _detect_ears_pattern(self, requirement: str) -> EARSPattern:
@@ -380,22 +709,27 @@ class SpecComplianceModule:
             
             requirement_text = requirement.strip()
             
-            # Check each EARS pattern in order
-            for pattern in self.ears_patterns:
-                if pattern['regex'].match(requirement_text):
-                    logger.debug(f"Detected EARS pattern: {pattern['type']} for requirement: {requirement_text[:50]}...")
-                    return pattern['type']
+            pattern_type = self._match_ears(requirement_text)
+            if pattern_type is not None:
+                logger.debug("Detected EARS pattern: %s for requirement: %s...", pattern_type, requirement_text[:50])
+                return pattern_type
             
             # If no pattern matches, return INVALID
-            logger.debug(f"No EARS pattern detected for requirement: {requirement_text[:50]}...")
+            logger.debug("No EARS pattern detected for requirement: %s...", requirement_text[:50])
             return EARSPattern.INVALID
             
         except Exception as e:
-            logger.error(f"Error detecting EARS pattern: {e}", exc_info=True)
+            logger.error("Error detecting EARS pattern: %s", e, exc_info=True)
             return EARSPattern.INVALID
     
     def _initialize_ears_patterns(self) -> List[Dict[str, Any]]:
-        """Initialize enhanced EARS pattern definitions."""
+        """
+        Initialize enhanced EARS pattern definitions.
+        
+        The conditional patterns keep a greedy ``.*,`` so triggers may contain
+        commas; patterns are only ever applied with ``match()``, which anchors
+        them at the start and keeps backtracking linear in the text length.
+        """
         return [
             {
                 'type': EARSPattern.UBIQUITOUS,
@@ -439,52 +773,82 @@ class SpecComplianceModule:
             }
         ]
     
-    def _initialize_incose_rules(self) -> List[Dict[str, Any]]:
+    def _match_ears(self, requirement_text: str) -> Optional[EARSPattern]:
+        """
+        Match already-stripped requirement text against all EARS patterns.
+        
+        Args:
+            requirement_text: Requirement text without surrounding whitespace
+            
+        Returns:
+            The first matching EARSPattern, or None
+        """
+        union, pattern_by_group = self._ears_matcher
+        match = union.match(requirement_text)
+        return pattern_by_group[match.lastgroup] if match else None
+    
+    def _build_ears_union(self, patterns: List[Dict[str, Any]]) -> Tuple[re.Pattern, Dict[str, EARSPattern]]:
+        """
+        Fuse the EARS pattern regexes into one alternation of named groups.
+        
+        Alternatives keep the definition order, so the first matching pattern
+        wins exactly as when trying each regex in turn; ``lastgroup`` names it.
+        """
+        union = re.compile(
+            '|'.join(
+                f"(?P<{pattern['type'].value}>{pattern['regex'].pattern.lstrip('^')})"
+                for pattern in patterns
+            ),
+            re.IGNORECASE
+        )
+        return union, {pattern['type'].value: pattern['type'] for pattern in patterns}
+    
+    def _initialize_incose_rules(self) -> Tuple[IncoseRule, ...]:
         """Initialize enhanced INCOSE quality rules."""
-        return [
-            {
-                'name': 'Completeness',
-                'description': 'Requirements should be complete and unambiguous',
-                'validator': self._check_completeness,
-                'weight': 0.25,
-                'critical': True
-            },
-            {
-                'name': 'Consistency',
-                'description': 'Requirements should be consistent with each other',
-                'validator': self._check_consistency,
-                'weight': 0.20,
-                'critical': True
-            },
-            {
-                'name': 'Verifiability',
-                'description': 'Requirements should be verifiable through testing',
-                'validator': self._check_verifiability,
-                'weight': 0.20,
-                'critical': True
-            },
-            {
-                'name': 'Clarity',
-                'description': 'Requirements should be clear and unambiguous',
-                'validator': self._check_clarity,
-                'weight': 0.15,
-                'critical': False
-            },
-            {
-                'name': 'Traceability',
-                'description': 'Requirements should be traceable to business needs',
-                'validator': self._check_traceability,
-                'weight': 0.10,
-                'critical': False
-            },
-            {
-                'name': 'Feasibility',
-                'description': 'Requirements should be technically feasible',
-                'validator': self._check_feasibility,
-                'weight': 0.10,
-                'critical': False
-            }
-        ]
+        return (
+            IncoseRule(
+                name='Completeness',
+                description='Requirements should be complete and unambiguous',
+                validator=self._check_completeness,
+                weight=0.25,
+                critical=True
+            ),
+            IncoseRule(
+                name='Consistency',
+                description='Requirements should be consistent with each other',
+                validator=self._check_consistency,
+                weight=0.20,
+                critical=True
+            ),
+            IncoseRule(
+                name='Verifiability',
+                description='Requirements should be verifiable through testing',
+                validator=self._check_verifiability,
+                weight=0.20,
+                critical=True
+            ),
+            IncoseRule(
+                name='Clarity',
+                description='Requirements should be clear and unambiguous',
+                validator=self._check_clarity,
+                weight=0.15,
+                critical=False
+            ),
+            IncoseRule(
+                name='Traceability',
+                description='Requirements should be traceable to business needs',
+                validator=self._check_traceability,
+                weight=0.10,
+                critical=False
+            ),
+            IncoseRule(
+                name='Feasibility',
+                description='Requirements should be technically feasible',
+                validator=self._check_feasibility,
+                weight=0.10,
+                critical=False
+            )
+        )
     
     def _initialize_document_templates(self) -> Dict[str, DocumentTemplate]:
         """Initialize document templates for requirements generation."""
@@ -529,21 +893,24 @@ class SpecComplianceModule:
         errors = []
         suggestions = []
         pattern_type = None
-        pattern_distribution = {}
+        pattern_distribution = Counter()
+        # Detected pattern per distinct text, so duplicated boilerplate is matched once
+        seen_patterns: Dict[str, Optional[EARSPattern]] = {}
         
         for req_id, req_data in requirements.items():
             if 'text' in req_data:
                 req_text = req_data['text'].strip()
-                matched_pattern = None
                 
-                # Check each EARS pattern
-                for pattern in self.ears_patterns:
-                    if pattern['regex'].match(req_text):
-                        matched_pattern = pattern['type']
-                        pattern_distribution[matched_pattern] = pattern_distribution.get(matched_pattern, 0) + 1
-                        if pattern_type is None:
-                            pattern_type = matched_pattern
-                        break
+                if req_text in seen_patterns:
+                    matched_pattern = seen_patterns[req_text]
+                else:
+                    matched_pattern = self._match_ears(req_text)
+                    seen_patterns[req_text] = matched_pattern
+                
+                if matched_pattern:
+                    pattern_distribution[matched_pattern] += 1
+                    if pattern_type is None:
+                        pattern_type = matched_pattern
                 
                 if not matched_pattern:
                     errors.append(f"Requirement {req_id} does not follow EARS patterns")
@@ -555,7 +922,7 @@ class SpecComplianceModule:
             'errors': errors,
             'suggestions': suggestions,
             'pattern_type': pattern_type,
-            'pattern_distribution': pattern_distribution
+            'pattern_distribution': dict(pattern_distribution)
         }
     
     def _validate_incose_rules(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
@@ -565,28 +932,33 @@ class SpecComplianceModule:
         compliance = {}
         overall_score = 0.0
         
-        for rule in self.incose_rules:
-            try:
-                rule_result = rule['validator'](requirements)
-                rule_name = rule['name']
-                rule_weight = rule.get('weight', 1.0)
-                
-                compliance[rule_name] = rule_result['is_valid']
+        # Sequential validators share one fused pass over the requirements; on
+        # the thread pool each validator runs only its own check, concurrently
+        if self._incose_executor is None:
+            self._requirement_checks_memo = (requirements, self._run_all_checks(requirements))
+        try:
+            rule_results = self._run_incose_validators(requirements)
+        finally:
+            self._requirement_checks_memo = None
+        
+        for rule, rule_result in zip(self.incose_rules, rule_results):
+            if isinstance(rule_result, Exception):
+                warnings.append(f"Error validating {rule.name}: {str(rule_result)}")
+                compliance[rule.name] = False
+                continue
+            
+            compliance[rule.name] = rule_result['is_valid']
+            
+            if rule_result['is_valid']:
+                overall_score += rule.weight
+            else:
+                warnings.extend(rule_result['warnings'])
+                if 'suggestions' in rule_result:
+                    suggestions.extend(rule_result['suggestions'])
                 
-                if rule_result['is_valid']:
-                    overall_score += rule_weight
-                else:
-                    warnings.extend(rule_result['warnings'])
-                    if 'suggestions' in rule_result:
-                        suggestions.extend(rule_result['suggestions'])
-                    
-                    # Add critical rule failures as errors if needed
-                    if rule.get('critical', False):
-                        warnings.append(f"CRITICAL: {rule_name} validation failed")
-                        
-            except Exception as e:
-                warnings.append(f"Error validating {rule['name']}: {str(e)}")
-                compliance[rule['name']] = False
+                # Add critical rule failures as errors if needed
+                if rule.critical:
+                    warnings.append(f"CRITICAL: {rule.name} validation failed")
         
         return {
             'is_valid': len(warnings) == 0,
@@ -596,37 +968,68 @@ class SpecComplianceModule:
             'quality_score': overall_score
         }
     
+    def _run_incose_validators(self, requirements: Dict[str, Any]) -> List[Any]:
+        """
+        Run every INCOSE rule validator over the requirements.
+        
+        Validators are read-only, so they may run concurrently on the thread
+        pool; results are always returned in rule order.
+        
+        Returns:
+            One entry per rule: the validator result, or the exception it raised
+        """
+        if self._incose_executor is None:
+            return [self._call_incose_validator(rule.validator, requirements)
+                    for rule in self.incose_rules]
+        
+        futures = [
+            self._incose_executor.submit(self._call_incose_validator, rule.validator, requirements)
+            for rule in self.incose_rules
+        ]
+        return [future.result() for future in futures]
+    
+    def _call_incose_validator(self, validator: Callable, requirements: Dict[str, Any]) -> Any:
+        """Call a validator, returning the exception instead of raising it."""
+        try:
+            return validator(requirements)
+        except Exception as e:
+            return e
+    
     def _check_completeness(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced check for requirements completeness."""
         warnings = []
         suggestions = []
         
-        required_fields = ['text', 'acceptance_criteria', 'user_story']
-        optional_fields = ['priority', 'source', 'rationale', 'dependencies']
+        # Read each field once into per-field columns, then emit warnings per requirement
+        req_ids = list(requirements)
+        req_values = list(requirements.values())
+        missing_columns = [[field for field in _REQUIRED_FIELDS if not req_data.get(field)]
+                           for req_data in req_values]
+        criteria_lengths = [
+            [len(criterion.strip()) for criterion in criteria] if isinstance(criteria, list) else None
+            for criteria in (req_data.get('acceptance_criteria') for req_data in req_values)
+        ]
+        user_stories = [req_data.get('user_story', _MISSING) for req_data in req_values]
+        brief_criteria = self._find_brief_criteria(criteria_lengths)
         
-        for req_id, req_data in requirements.items():
+        for position, (req_id, missing_fields, lengths, user_story) in enumerate(zip(
+                req_ids, missing_columns, criteria_lengths, user_stories)):
             # Check required fields
-            for field in required_fields:
-                if field not in req_data or not req_data[field]:
-                    warnings.append(f"Requirement {req_id} missing required field: {field}")
-                    suggestions.append(f"Add {field} to requirement {req_id}")
+            for field in missing_fields:
+                warnings.append(f"Requirement {req_id} missing required field: {field}")
+                suggestions.append(f"Add {field} to requirement {req_id}")
             
             # Check acceptance criteria quality
-            if 'acceptance_criteria' in req_data:
-                criteria = req_data['acceptance_criteria']
-                if isinstance(criteria, list) and len(criteria) == 0:
+            if lengths is not None:
+                if not lengths:
                     warnings.append(f"Requirement {req_id} has empty acceptance criteria")
-                elif isinstance(criteria, list):
-                    for idx, criterion in enumerate(criteria):
-                        if len(criterion.strip()) < 10:
-                            warnings.append(f"Acceptance criterion {idx+1} in {req_id} is too brief")
+                for idx in brief_criteria.get(position, ()):
+                    warnings.append(f"Acceptance criterion {idx+1} in {req_id} is too brief")
             
             # Check user story format
-            if 'user_story' in req_data:
-                user_story = req_data['user_story']
-                if not self._is_valid_user_story_format(user_story):
-                    warnings.append(f"User story in {req_id} doesn't follow 'As a... I want... So that...' format")
-                    suggestions.append(f"Reformat user story in {req_id} using standard template")
+            if user_story is not _MISSING and not self._is_valid_user_story_format(user_story):
+                warnings.append(f"User story in {req_id} doesn't follow 'As a... I want... So that...' format")
+                suggestions.append(f"Reformat user story in {req_id} using standard template")
         
         return {
             'is_valid': len(warnings) == 0,
@@ -634,6 +1037,38 @@ class SpecComplianceModule:
             'suggestions': suggestions
         }
     
+    def _find_brief_criteria(self, criteria_lengths: List[Optional[List[int]]]) -> Dict[int, List[int]]:
+        """
+        Locate acceptance criteria that are too brief across all requirements.
+        
+        The lengths of every requirement are compared in a single vectorized
+        pass, so only the flagged criteria are visited in Python.
+        
+        Args:
+            criteria_lengths: Stripped criterion lengths per requirement, or None
+            
+        Returns:
+            Criterion indices keyed by requirement position, in criterion order
+        """
+        import numpy as np  # deferred so importing the module stays cheap
+        
+        counts = np.fromiter((len(lengths) if lengths else 0 for lengths in criteria_lengths),
+                             dtype=np.int64, count=len(criteria_lengths))
+        flat_lengths = np.fromiter(chain.from_iterable(lengths for lengths in criteria_lengths if lengths),
+                                   dtype=np.int64, count=int(counts.sum()))
+        brief_flat = np.flatnonzero(flat_lengths < _BRIEF_CRITERION_LENGTH)
+        if not brief_flat.size:
+            return {}
+        
+        ends = np.cumsum(counts)
+        positions = np.searchsorted(ends, brief_flat, side='right')
+        offsets = brief_flat - (ends - counts)[positions]
+        
+        brief_criteria: Dict[int, List[int]] = {}
+        for position, idx in zip(positions.tolist(), offsets.tolist()):
+            brief_criteria.setdefault(position, []).append(idx)
+        return brief_criteria
+    
     def _check_consistency(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced check for requirements consistency."""
         warnings = []
@@ -647,16 +1082,14 @@ class SpecComplianceModule:
             if 'text' in req_data:
                 req_text = req_data['text']
                 
-                # Extract system entity
-                entity_match = re.search(r'THE\s+(\w+)\s+SHALL', req_text, re.IGNORECASE)
+                # Extract system entity and its action verb in one search
+                entity_match = _ENTITY_ACTION_RE.search(req_text)
                 if entity_match:
                     entity = entity_match.group(1).upper()
                     system_entities.add(entity)
                     
-                    # Extract action verb
-                    action_match = re.search(r'SHALL\s+(\w+)', req_text, re.IGNORECASE)
-                    if action_match:
-                        action = action_match.group(1).lower()
+                    if entity_match.group(2):
+                        action = entity_match.group(2).lower()
                         if entity not in action_verbs:
                             action_verbs[entity] = {}
                         if action not in action_verbs[entity]:
@@ -670,15 +1103,11 @@ class SpecComplianceModule:
         
         # Check for potentially conflicting actions
         for entity, actions in action_verbs.items():
-            conflicting_actions = ['start', 'stop', 'enable', 'disable', 'allow', 'prevent']
             found_conflicts = []
             for action in actions:
-                for conflict in conflicting_actions:
-                    if action == conflict:
-                        opposite = {'start': 'stop', 'stop': 'start', 'enable': 'disable', 
-                                  'disable': 'enable', 'allow': 'prevent', 'prevent': 'allow'}
-                        if opposite.get(action) in actions:
-                            found_conflicts.append((action, opposite[action]))
+                opposite = _OPPOSITE_ACTIONS.get(action)
+                if opposite in actions:
+                    found_conflicts.append((action, opposite))
             
             for conflict_pair in found_conflicts:
                 warnings.append(f"Potentially conflicting actions for {entity}: {conflict_pair[0]} vs {conflict_pair[1]}")
@@ -691,142 +1120,222 @@ class SpecComplianceModule:
     
     def _check_verifiability(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced check for requirements verifiability."""
-        warnings = []
-        suggestions = []
-        
-        testable_keywords = ['shall', 'must', 'should', 'will', 'can', 'verify', 'validate', 'test', 'measure']
-        quantifiable_terms = ['within', 'less than', 'greater than', 'at least', 'at most', 'exactly', 'between']
-        
-        for req_id, req_data in requirements.items():
-            if 'acceptance_criteria' in req_data:
-                criteria = req_data['acceptance_criteria']
-                if isinstance(criteria, list):
-                    for idx, criterion in enumerate(criteria):
-                        criterion_lower = criterion.lower()
-                        
-                        # Check for testable keywords
-                        has_testable_keyword = any(keyword in criterion_lower for keyword in testable_keywords)
-                        if not has_testable_keyword:
-                            warnings.append(f"Criterion {idx+1} in {req_id} may not be testable: {criterion[:50]}...")
-                            suggestions.append(f"Add testable verbs (shall, must, can) to criterion {idx+1} in {req_id}")
-                        
-                        # Check for quantifiable terms for performance requirements
-                        if any(perf_word in criterion_lower for perf_word in ['performance', 'speed', 'time', 'latency', 'throughput']):
-                            has_quantifiable = any(term in criterion_lower for term in quantifiable_terms)
-                            if not has_quantifiable:
-                                warnings.append(f"Performance criterion {idx+1} in {req_id} lacks quantifiable metrics")
-                                suggestions.append(f"Add specific metrics to performance criterion {idx+1} in {req_id}")
-                        
-                        # Check for vague terms
-                        vague_terms = ['appropriate', 'suitable', 'adequate', 'reasonable', 'efficient', 'user-friendly']
-                        found_vague = [term for term in vague_terms if term in criterion_lower]
-                        if found_vague:
-                            warnings.append(f"Criterion {idx+1} in {req_id} contains vague terms: {', '.join(found_vague)}")
-                            suggestions.append(f"Replace vague terms with specific, measurable criteria in {req_id}")
-        
-        return {
-            'is_valid': len(warnings) == 0,
-            'warnings': warnings,
-            'suggestions': suggestions
-        }
+        return self._requirement_check(requirements, 'verifiability')
     
     def _check_clarity(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Check requirements clarity and readability."""
-        warnings = []
-        suggestions = []
-        
-        for req_id, req_data in requirements.items():
-            if 'text' in req_data:
-                req_text = req_data['text']
-                
-                # Check sentence length (readability)
-                sentences = req_text.split('.')
-                for sentence in sentences:
-                    words = sentence.strip().split()
-                    if len(words) > 25:  # Arbitrary threshold for complex sentences
-                        warnings.append(f"Requirement {req_id} contains overly complex sentence")
-                        suggestions.append(f"Break down complex sentences in {req_id} for better clarity")
-                
-                # Check for ambiguous pronouns
-                ambiguous_pronouns = ['it', 'this', 'that', 'they', 'them']
-                for pronoun in ambiguous_pronouns:
-                    if f' {pronoun} ' in req_text.lower():
-                        warnings.append(f"Requirement {req_id} contains ambiguous pronoun: {pronoun}")
-                        suggestions.append(f"Replace ambiguous pronouns with specific nouns in {req_id}")
-        
-        return {
-            'is_valid': len(warnings) == 0,
-            'warnings': warnings,
-            'suggestions': suggestions
-        }
+        return self._requirement_check(requirements, 'clarity')
     
     def _check_traceability(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Check requirements traceability to business needs."""
-        warnings = []
-        suggestions = []
+        return self._requirement_check(requirements, 'traceability')
+    
+    def _check_feasibility(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Check technical feasibility of requirements."""
+        return self._requirement_check(requirements, 'feasibility')
+    
+    def _requirement_check(self, requirements: Dict[str, Any], name: str) -> Dict[str, Any]:
+        """
+        Return the result of one per-requirement check over ``requirements``.
         
-        for req_id, req_data in requirements.items():
-            # Check for business justification
-            if 'rationale' not in req_data:
-                warnings.append(f"Requirement {req_id} lacks business rationale")
-                suggestions.append(f"Add rationale field to {req_id} explaining business need")
+        Reuses the results computed for the INCOSE validation in progress when
+        they were computed for this very mapping, so each requirement is
+        walked once per validation rather than once per checker. Otherwise
+        only the requested check runs.
+        
+        Args:
+            requirements: Requirements being checked
+            name: Check name, as keyed by ``_run_all_checks``
             
-            # Check for source attribution
-            if 'source' not in req_data:
-                warnings.append(f"Requirement {req_id} lacks source attribution")
-                suggestions.append(f"Add source field to {req_id} identifying requirement origin")
+        Returns:
+            The check result dictionary
             
-            # Check user story connection
-            if 'user_story' in req_data:
-                user_story = req_data['user_story']
-                if 'so that' not in user_story.lower():
-                    warnings.append(f"User story in {req_id} lacks business value statement")
-                    suggestions.append(f"Add 'so that' clause to user story in {req_id}")
+        Raises:
+            Exception: The error raised by the requested checker, if any
+        """
+        memo = self._requirement_checks_memo
+        if memo is not None and memo[0] is requirements:
+            result = memo[1][name]
+        else:
+            result = self._run_all_checks(requirements, (name,))[name]
         
-        return {
-            'is_valid': len(warnings) == 0,
-            'warnings': warnings,
-            'suggestions': suggestions
-        }
+        if isinstance(result, Exception):
+            raise result
+        return result
     
-    def _check_feasibility(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Check technical feasibility of requirements."""
-        warnings = []
-        suggestions = []
+    def _run_all_checks(self, requirements: Dict[str, Any],
+                        names: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """
+        Run the verifiability, clarity, traceability and feasibility checks in one pass.
+        
+        A checker that raises stops running and its exception is returned in
+        place of its result, leaving the other checkers unaffected.
+        
+        Args:
+            requirements: Requirements being checked
+            names: Checks to run; all four when omitted
         
-        # Define feasibility indicators
-        high_risk_terms = ['real-time', 'instantaneous', '100%', 'never fail', 'always', 'perfect']
-        technical_constraints = ['cpu', 'gpu', 'memory', 'disk', 'network', 'latency', 'throughput']
+        Returns:
+            Check name mapped to its result dictionary, or to the exception it raised
+        """
+        if (self.config.get('parallel_requirement_checks', False)
+                and len(requirements) >= max(PARALLEL_CHECK_MIN_REQUIREMENTS, 1)):
+            return self._run_all_checks_parallel(requirements, names)
+        
+        checks = {
+            'verifiability': self._verifiability_issues,
+            'clarity': self._clarity_issues,
+            'traceability': self._traceability_issues,
+            'feasibility': self._feasibility_issues
+        }
+        if names is not None:
+            checks = {name: checks[name] for name in names}
+        collected = {name: ([], []) for name in checks}
+        failures: Dict[str, Exception] = {}
         
         for req_id, req_data in requirements.items():
-            if 'text' in req_data:
-                req_text = req_data['text'].lower()
+            for name, check in checks.items():
+                if name in failures:
+                    continue
+                try:
+                    check(req_id, req_data, *collected[name])
+                except Exception as e:
+                    failures[name] = e
+        
+        results: Dict[str, Any] = {}
+        for name, (warnings, suggestions) in collected.items():
+            results[name] = failures.get(name) or {
+                'is_valid': len(warnings) == 0,
+                'warnings': warnings,
+                'suggestions': suggestions
+            }
+        return results
+    
+    def _run_all_checks_parallel(self, requirements: Dict[str, Any],
+                                 names: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """
+        Run ``_run_all_checks`` on contiguous chunks of requirements in worker processes.
+        
+        Chunk results are merged in requirement order, so warnings come out
+        exactly as from a sequential pass; a checker failing in any chunk
+        fails as a whole with the first error raised.
+        """
+        workers = self.config.get('requirement_check_workers') or os.cpu_count() or 1
+        if self._check_process_pool is None:
+            self._check_process_pool = ProcessPoolExecutor(max_workers=workers)
+        
+        items = list(requirements.items())
+        chunk_size = -(-len(items) // workers)
+        chunks = [dict(items[start:start + chunk_size]) for start in range(0, len(items), chunk_size)]
+        
+        results: Dict[str, Any] = {}
+        for chunk_results in self._check_process_pool.map(_run_checks_in_worker, chunks,
+                                                          [names] * len(chunks)):
+            for name, result in chunk_results.items():
+                merged = results.get(name)
+                if merged is None or isinstance(result, Exception):
+                    if not isinstance(merged, Exception):
+                        results[name] = result
+                elif not isinstance(merged, Exception):
+                    merged['warnings'].extend(result['warnings'])
+                    merged['suggestions'].extend(result['suggestions'])
+        
+        for result in results.values():
+            if not isinstance(result, Exception):
+                result['is_valid'] = len(result['warnings']) == 0
+        return results
+    
+    def _verifiability_issues(self, req_id: str, req_data: Dict[str, Any],
+                              warnings: List[str], suggestions: List[str]):
+        """Append verifiability issues of one requirement."""
+        criteria = req_data.get('acceptance_criteria')
+        if isinstance(criteria, list):
+            for idx, criterion in enumerate(criteria):
+                criterion_lower = criterion.lower()
+                
+                # Check for testable keywords
+                has_testable_keyword = any(keyword in criterion_lower for keyword in _TESTABLE_KEYWORDS)
+                if not has_testable_keyword:
+                    warnings.append(f"Criterion {idx+1} in {req_id} may not be testable: {criterion[:50]}...")
+                    suggestions.append(f"Add testable verbs (shall, must, can) to criterion {idx+1} in {req_id}")
                 
-                # Check for high-risk terms
-                found_risks = [term for term in high_risk_terms if term in req_text]
-                if found_risks:
-                    warnings.append(f"Requirement {req_id} contains high-risk terms: {', '.join(found_risks)}")
-                    suggestions.append(f"Review feasibility of absolute terms in {req_id}")
+                # Check for quantifiable terms for performance requirements
+                if any(perf_word in criterion_lower for perf_word in _PERFORMANCE_WORDS):
+                    has_quantifiable = any(term in criterion_lower for term in _QUANTIFIABLE_TERMS)
+                    if not has_quantifiable:
+                        warnings.append(f"Performance criterion {idx+1} in {req_id} lacks quantifiable metrics")
+                        suggestions.append(f"Add specific metrics to performance criterion {idx+1} in {req_id}")
                 
-                # Check for technical constraints without specifications
-                found_constraints = [term for term in technical_constraints if term in req_text]
-                if found_constraints:
-                    # Check if there are specific values mentioned
-                    has_numbers = re.search(r'\d+', req_text)
-                    if not has_numbers:
-                        warnings.append(f"Requirement {req_id} mentions technical constraints without specific values")
-                        suggestions.append(f"Add specific technical specifications to {req_id}")
+                # Check for vague terms
+                found_vague = [term for term in _VAGUE_TERMS if term in criterion_lower]
+                if found_vague:
+                    warnings.append(f"Criterion {idx+1} in {req_id} contains vague terms: {', '.join(found_vague)}")
+                    suggestions.append(f"Replace vague terms with specific, measurable criteria in {req_id}")
+    
+    def _clarity_issues(self, req_id: str, req_data: Dict[str, Any],
+                        warnings: List[str], suggestions: List[str]):
+        """Append clarity issues of one requirement."""
+        req_text = req_data.get('text')
+        if req_text:
+            # Check sentence length (readability); each word takes at least two
+            # characters with its separator, so shorter sentences are not scanned
+            for start, end in _sentence_spans(req_text):
+                if (end - start > 2 * _MAX_SENTENCE_WORDS
+                        and _has_more_words(req_text, start, end, _MAX_SENTENCE_WORDS)):
+                    warnings.append(f"Requirement {req_id} contains overly complex sentence")
+                    suggestions.append(f"Break down complex sentences in {req_id} for better clarity")
+            
+            # Check for ambiguous pronouns
+            found_pronouns = {match.group(1).lower() for match in _AMBIGUOUS_PRONOUN_RE.finditer(req_text)}
+            for pronoun in _AMBIGUOUS_PRONOUNS:
+                if pronoun in found_pronouns:
+                    warnings.append(f"Requirement {req_id} contains ambiguous pronoun: {pronoun}")
+                    suggestions.append(f"Replace ambiguous pronouns with specific nouns in {req_id}")
+    
+    def _traceability_issues(self, req_id: str, req_data: Dict[str, Any],
+                             warnings: List[str], suggestions: List[str]):
+        """Append traceability issues of one requirement."""
+        # Check for business justification
+        if 'rationale' not in req_data:
+            warnings.append(f"Requirement {req_id} lacks business rationale")
+            suggestions.append(f"Add rationale field to {req_id} explaining business need")
         
-        return {
-            'is_valid': len(warnings) == 0,
-            'warnings': warnings,
-            'suggestions': suggestions
-        }
+        # Check for source attribution
+        if 'source' not in req_data:
+            warnings.append(f"Requirement {req_id} lacks source attribution")
+            suggestions.append(f"Add source field to {req_id} identifying requirement origin")
+        
+        # Check user story connection
+        user_story = req_data.get('user_story')
+        if user_story is not None:
+            if 'so that' not in user_story.lower():
+                warnings.append(f"User story in {req_id} lacks business value statement")
+                suggestions.append(f"Add 'so that' clause to user story in {req_id}")
+    
+    def _feasibility_issues(self, req_id: str, req_data: Dict[str, Any],
+                            warnings: List[str], suggestions: List[str]):
+        """Append feasibility issues of one requirement."""
+        req_text = req_data.get('text')
+        if req_text:
+            req_text = req_text.lower()
+            
+            # Check for high-risk terms
+            found_risks = [term for term in _HIGH_RISK_TERMS if term in req_text]
+            if found_risks:
+                warnings.append(f"Requirement {req_id} contains high-risk terms: {', '.join(found_risks)}")
+                suggestions.append(f"Review feasibility of absolute terms in {req_id}")
+            
+            # Check for technical constraints without specifications
+            if any(term in req_text for term in _TECHNICAL_CONSTRAINTS):
+                # Check if there are specific values mentioned
+                if not _HAS_DIGIT_RE.search(req_text):
+                    warnings.append(f"Requirement {req_id} mentions technical constraints without specific values")
+                    suggestions.append(f"Add specific technical specifications to {req_id}")
     
     def _is_testable_criterion(self, criterion: str) -> bool:
         """Check if an acceptance criterion is testable."""
-        testable_keywords = ['shall', 'must', 'should', 'will', 'can', 'verify', 'validate', 'test']
-        return any(keyword in criterion.lower() for keyword in testable_keywords)
+        criterion_lower = criterion.lower()
+        return any(keyword in criterion_lower for keyword in _CRITERION_TESTABLE_KEYWORDS)
     
     def _create_property_from_criterion(self, req_id: str, idx: int, criterion: str) -> Optional[Property]:
         """Create a property object from an acceptance criterion."""
@@ -842,7 +1351,7 @@ class SpecComplianceModule:
                 validation_criteria={'criterion': criterion}
             )
         except Exception as e:
-            logger.error(f"Error creating property from criterion: {e}", exc_info=True)
+            logger.error("Error creating property from criterion: %s", e, exc_info=True)
             return None
     
     def _create_component_task(self, component_name: str, component_data: Dict[str, Any]) -> Optional[TaskItem]:
@@ -856,10 +1365,10 @@ class SpecComplianceModule:
                 description=component_data.get('description', f"Implementation of {component_name} component"),
                 requirements_refs=component_data.get('requirements', []),
                 dependencies=component_data.get('dependencies', []),
-                estimated_effort=component_data.get('effort', 'Medium')
+                estimated_effort=_canonical(component_data.get('effort', 'Medium'), _EFFORT_LEVELS)
             )
         except Exception as e:
-            logger.error(f"Error creating component task: {e}", exc_info=True)
+            logger.error("Error creating component task: %s", e, exc_info=True)
             return None
     
     def _create_property_test_task(self, prop_data: Dict[str, Any]) -> Optional[TaskItem]:
@@ -876,13 +1385,15 @@ class SpecComplianceModule:
                 estimated_effort='Small'
             )
         except Exception as e:
-            logger.error(f"Error creating property test task: {e}", exc_info=True)
+            logger.error("Error creating property test task: %s", e, exc_info=True)
             return None
     
     def _estimate_duration(self, tasks: List[TaskItem]) -> str:
         """Estimate total duration for task list."""
-        effort_weights = {'Small': 1, 'Medium': 3, 'Large': 5}
-        total_weight = sum(effort_weights.get(task.estimated_effort, 3) for task in tasks)
+        # Count effort levels in C, then weight the handful of distinct levels
+        effort_counts = Counter(map(attrgetter('estimated_effort'), tasks))
+        total_weight = sum(_EFFORT_WEIGHTS.get(effort, _DEFAULT_EFFORT_WEIGHT) * count
+                           for effort, count in effort_counts.items())
         
         if total_weight <= 10:
             return "1-2 weeks"
@@ -890,23 +1401,25 @@ class SpecComplianceModule:
             return "2-4 weeks"
         else:
             return "4+ weeks"
+    
     def _generate_ears_suggestions(self, req_text: str, req_id: str) -> List[str]:
         """Generate specific suggestions for EARS pattern compliance."""
         suggestions = []
+        req_text_lower = req_text.lower()
         
         # Analyze the requirement text to provide targeted suggestions
-        if 'shall' not in req_text.lower():
+        if 'shall' not in req_text_lower:
             suggestions.append(f"Add 'SHALL' verb to requirement {req_id} for EARS pattern compliance")
         
-        if not re.search(r'^(THE|WHEN|IF|WHILE|WHERE)', req_text, re.IGNORECASE):
+        if not _EARS_PREFIX_RE.match(req_text):
             suggestions.append(f"Start requirement {req_id} with EARS pattern keyword (THE, WHEN, IF, WHILE, WHERE)")
         
         # Suggest specific patterns based on content
-        if any(trigger in req_text.lower() for trigger in ['when', 'if', 'after', 'before', 'upon']):
+        if any(trigger in req_text_lower for trigger in _EVENT_TRIGGER_WORDS):
             suggestions.append(f"Consider using event-driven pattern (WHEN..., THE system SHALL...) for {req_id}")
-        elif any(state in req_text.lower() for state in ['while', 'during', 'throughout']):
+        elif any(state in req_text_lower for state in _STATE_TRIGGER_WORDS):
             suggestions.append(f"Consider using state-driven pattern (WHILE..., THE system SHALL...) for {req_id}")
-        elif any(condition in req_text.lower() for condition in ['where', 'provided', 'given']):
+        elif any(condition in req_text_lower for condition in _OPTIONAL_TRIGGER_WORDS):
             suggestions.append(f"Consider using optional pattern (WHERE..., THE system SHALL...) for {req_id}")
         else:
             suggestions.append(f"Consider using ubiquitous pattern (THE system SHALL...) for {req_id}")
@@ -915,10 +1428,7 @@ class SpecComplianceModule:
     
     def _is_valid_user_story_format(self, user_story: str) -> bool:
         """Check if user story follows standard format."""
-        user_story_lower = user_story.lower()
-        return ('as a' in user_story_lower and 
-                'i want' in user_story_lower and 
-                'so that' in user_story_lower)
+        return _is_user_story(user_story)
     
     def _get_document_template(self, template_name: str) -> Optional[DocumentTemplate]:
         """Get document template by name."""
@@ -927,32 +1437,11 @@ class SpecComplianceModule:
     def _generate_introduction(self, requirements_data: Dict[str, Any], 
                              template: DocumentTemplate) -> str:
         """Generate introduction section for requirements document."""
-        intro_template = """
-## Introduction
-
-This document specifies the requirements for {title}. The requirements follow modern 
-specification standards including EARS (Easy Approach to Requirements Syntax) patterns 
-and INCOSE quality guidelines.
-
-### Purpose
-
-{purpose}
-
-### Scope
-
-{scope}
-
-### Document Structure
-
-This document is organized according to the {template_name} template and includes:
-{sections}
-        """.strip()
-        
         purpose = requirements_data.get('purpose', 'Define system requirements and acceptance criteria')
         scope = requirements_data.get('scope', 'This document covers functional and non-functional requirements')
-        sections = '\n'.join(f"- {section.title()}" for section in template.sections)
+        sections = _sections_markdown(tuple(template.sections))
         
-        return intro_template.format(
+        return _INTRODUCTION_TEMPLATE.format(
             title=requirements_data.get('title', 'System Requirements'),
             purpose=purpose,
             scope=scope,
@@ -982,98 +1471,79 @@ This document is organized according to the {template_name} template and include
                            template: DocumentTemplate) -> Dict[str, Dict[str, Any]]:
         """Format requirements according to template rules."""
         formatted_requirements = {}
+        # Template rules are the same for every requirement; resolve them once
+        hierarchical = template.format_rules.get('requirement_numbering') == 'hierarchical'
         
         for req_id, req_data in requirements_data.get('requirements', {}).items():
-            formatted_req = {
+            formatted_requirements[req_id] = {
                 'id': req_id,
                 'title': req_data.get('title', f'Requirement {req_id}'),
                 'text': req_data.get('text', ''),
                 'user_story': req_data.get('user_story', ''),
                 'acceptance_criteria': req_data.get('acceptance_criteria', []),
-                'priority': req_data.get('priority', 'Medium'),
+                'priority': _canonical(req_data.get('priority', 'Medium'), _PRIORITY_LEVELS),
                 'source': req_data.get('source', 'Unknown'),
                 'rationale': req_data.get('rationale', ''),
-                'dependencies': req_data.get('dependencies', [])
+                'dependencies': req_data.get('dependencies', []),
+                'display_id': self._format_hierarchical_id(req_id) if hierarchical else req_id
             }
-            
-            # Apply template-specific formatting
-            if template.format_rules.get('requirement_numbering') == 'hierarchical':
-                formatted_req['display_id'] = self._format_hierarchical_id(req_id)
-            else:
-                formatted_req['display_id'] = req_id
-            
-            formatted_requirements[req_id] = formatted_req
         
         return formatted_requirements
     
     def _format_hierarchical_id(self, req_id: str) -> str:
         """Format requirement ID in hierarchical format."""
-        # Convert flat ID to hierarchical (e.g., "req_1_2" -> "1.2")
-        if '_' in req_id:
-            parts = req_id.replace('req_', '').split('_')
-            return '.'.join(parts)
-        return req_id
+        return _hierarchical_id(req_id)
     
     def _export_to_markdown(self, document: RequirementsDocument) -> str:
         """Export requirements document to Markdown format."""
-        content = []
+        # Lines are streamed with a leading newline so the output has no trailing one
+        buffer = io.StringIO()
+        write = buffer.write
         
         # Title and metadata
-        content.append(f"# {document.title}")
-        content.append(f"**Version:** {document.version}")
-        content.append(f"**Date:** {document.date}")
-        content.append("")
+        write(f"# {document.title}\n**Version:** {document.version}\n**Date:** {document.date}\n")
         
         # Introduction
-        content.append(document.introduction)
-        content.append("")
+        write(f"\n{document.introduction}\n")
         
         # Glossary
         if document.glossary:
-            content.append("## Glossary")
-            content.append("")
+            write("\n## Glossary\n")
             for term, definition in sorted(document.glossary.items()):
-                content.append(f"- **{term}**: {definition}")
-            content.append("")
+                write(f"\n- **{term}**: {definition}")
+            write("\n")
         
         # Requirements
-        content.append("## Requirements")
-        content.append("")
+        write("\n## Requirements\n")
         
         for req_id, req_data in document.requirements.items():
-            content.append(f"### {req_data.get('display_id', req_id)}: {req_data.get('title', '')}")
-            content.append("")
+            write(f"\n### {req_data.get('display_id', req_id)}: {req_data.get('title', '')}\n")
             
             if req_data.get('user_story'):
-                content.append(f"**User Story:** {req_data['user_story']}")
-                content.append("")
+                write(f"\n**User Story:** {req_data['user_story']}\n")
             
             if req_data.get('text'):
-                content.append(f"**Requirement:** {req_data['text']}")
-                content.append("")
+                write(f"\n**Requirement:** {req_data['text']}\n")
             
             if req_data.get('acceptance_criteria'):
-                content.append("**Acceptance Criteria:**")
+                write("\n**Acceptance Criteria:**")
                 for idx, criterion in enumerate(req_data['acceptance_criteria'], 1):
-                    content.append(f"{idx}. {criterion}")
-                content.append("")
+                    write(f"\n{idx}. {criterion}")
+                write("\n")
             
             if req_data.get('rationale'):
-                content.append(f"**Rationale:** {req_data['rationale']}")
-                content.append("")
+                write(f"\n**Rationale:** {req_data['rationale']}\n")
             
             if req_data.get('dependencies'):
-                content.append(f"**Dependencies:** {', '.join(req_data['dependencies'])}")
-                content.append("")
+                write(f"\n**Dependencies:** {', '.join(req_data['dependencies'])}\n")
         
         # Metadata
         if document.metadata:
-            content.append("## Document Metadata")
-            content.append("")
+            write("\n## Document Metadata\n")
             for key, value in document.metadata.items():
-                content.append(f"- **{key.replace('_', ' ').title()}:** {value}")
+                write(f"\n- **{key.replace('_', ' ').title()}:** {value}")
         
-        return '\n'.join(content)
+        return buffer.getvalue()
     
     def _export_to_json(self, document: RequirementsDocument) -> str:
         """Export requirements document to JSON format."""
@@ -1086,84 +1556,68 @@ This document is organized according to the {template_name} template and include
             'requirements': document.requirements,
             'metadata': document.metadata
         }
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    doc_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            except TypeError:
+                pass  # Fall back to the stdlib encoder for types orjson rejects
         return json.dumps(doc_dict, indent=2, ensure_ascii=False)
     
     def _export_to_html(self, document: RequirementsDocument) -> str:
         """Export requirements document to HTML format."""
-        # Pre-process introduction to avoid backslash in f-string
-        introduction_html = document.introduction.replace('\n', '<br>')
+        buffer = io.StringIO()
+        write = buffer.write
         
-        # Pre-process glossary items
-        glossary_html = ''.join(
-            f'<dt><strong>{term}</strong></dt><dd>{definition}</dd>' 
-            for term, definition in document.glossary.items()
-        )
+        write(_HTML_HEAD.format(
+            title=_html_text(document.title),
+            version=_html_text(document.version),
+            date=_html_text(document.date),
+            introduction=_html_text(document.introduction).replace('\n', '<br>')
+        ))
         
-        # Pre-process requirements
-        requirements_html = ''.join(
-            self._format_requirement_html(req_id, req_data) 
-            for req_id, req_data in document.requirements.items()
-        )
+        for term, definition in document.glossary.items():
+            write(f'<dt><strong>{_html_text(term)}</strong></dt><dd>{_html_text(definition)}</dd>')
         
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{document.title}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }}
-        h1, h2, h3 {{ color: #333; }}
-        .metadata {{ background: #f5f5f5; padding: 15px; border-radius: 5px; }}
-        .requirement {{ border-left: 3px solid #007acc; padding-left: 15px; margin: 20px 0; }}
-        .acceptance-criteria {{ background: #f9f9f9; padding: 10px; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <h1>{document.title}</h1>
-    <div class="metadata">
-        <p><strong>Version:</strong> {document.version}</p>
-        <p><strong>Date:</strong> {document.date}</p>
-    </div>
-    
-    <div class="introduction">
-        {introduction_html}
-    </div>
-    
-    <h2>Glossary</h2>
-    <dl>
-        {glossary_html}
-    </dl>
-    
-    <h2>Requirements</h2>
-    {requirements_html}
-    
-</body>
-</html>"""
+        write(_HTML_REQUIREMENTS_HEADING)
+        
+        for req_id, req_data in document.requirements.items():
+            self._write_requirement_html(write, req_id, req_data)
         
-        return html_content
+        write(_HTML_TAIL)
+        
+        return buffer.getvalue()
     
-    def _format_requirement_html(self, req_id: str, req_data: Dict[str, Any]) -> str:
-        """Format a single requirement as HTML."""
-        html = f"""
-        <div class="requirement">
-            <h3>{req_data.get('display_id', req_id)}: {req_data.get('title', '')}</h3>
-            {f'<p><strong>User Story:</strong> {req_data["user_story"]}</p>' if req_data.get('user_story') else ''}
-            {f'<p><strong>Requirement:</strong> {req_data["text"]}</p>' if req_data.get('text') else ''}
-            {self._format_acceptance_criteria_html(req_data.get('acceptance_criteria', []))}
-            {f'<p><strong>Rationale:</strong> {req_data["rationale"]}</p>' if req_data.get('rationale') else ''}
-        </div>
-        """
-        return html
+    def _write_requirement_html(self, write: Callable[[str], Any], req_id: str, req_data: Dict[str, Any]):
+        """Write a single requirement as HTML, skipping absent optional parts."""
+        display_id = _html_text(req_data.get('display_id', req_id))
+        title = _html_text(req_data.get('title', ''))
+        write(f'\n        <div class="requirement">\n            <h3>{display_id}: {title}</h3>\n            ')
+        if req_data.get('user_story'):
+            write(f'<p><strong>User Story:</strong> {_html_text(req_data["user_story"])}</p>')
+        write('\n            ')
+        if req_data.get('text'):
+            write(f'<p><strong>Requirement:</strong> {_html_text(req_data["text"])}</p>')
+        write('\n            ')
+        self._write_acceptance_criteria_html(write, req_data.get('acceptance_criteria', []))
+        write('\n            ')
+        if req_data.get('rationale'):
+            write(f'<p><strong>Rationale:</strong> {_html_text(req_data["rationale"])}</p>')
+        write('\n        </div>\n        ')
     
-    def _format_acceptance_criteria_html(self, criteria: List[str]) -> str:
-        """Format acceptance criteria as HTML."""
+    def _write_acceptance_criteria_html(self, write: Callable[[str], Any], criteria: List[str]):
+        """Write acceptance criteria as HTML."""
         if not criteria:
-            return ''
+            return
         
-        criteria_html = '<div class="acceptance-criteria"><strong>Acceptance Criteria:</strong><ol>'
+        write('<div class="acceptance-criteria"><strong>Acceptance Criteria:</strong><ol>')
         for criterion in criteria:
-            criteria_html += f'<li>{criterion}</li>'
-        criteria_html += '</ol></div>'
-        
-        return criteria_html
\ No newline at end of file
+            write(f'<li>{_html_text(criterion)}</li>')
+        write('</ol></div>')
+
+
+def _run_checks_in_worker(requirements: Dict[str, Any],
+                          names: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """Process pool entry point running the per-requirement checks on one chunk."""
+    return SpecComplianceModule()._run_all_checks(requirements, names)
@@ -6,207 +6,291 @@ This script shows how acceptance criteria are analyzed and mapped
 to concrete property tests, fulfilling the requirements of task 2.3.
 """
 
+import hashlib
+import io
 import sys
 import os
-sys.path.insert(0, os.path.dirname(__file__))
 
-from core.design_property_generator import DesignPropertyGenerator
-from pathlib import Path
+if not __package__:
+    # Script mode: make the sibling ``core`` package importable
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
 import json
 
+# Realistic VTT requirements with acceptance criteria, shared by every demo run
+_VTT_REQUIREMENTS = MappingProxyType({
+    "title": "VTT Modernization Requirements",
+    "version": "2.0.0",
+    "description": "Requirements for modernizing the VTT system with property-based testing",
+    "requirements": {
+        "req_transcription_001": {
+            "title": "Audio Transcription Processing",
+            "text": "THE VTT_System SHALL process audio transcription efficiently and accurately",
+            "user_story": "As a user, I want accurate audio transcription, so that I can convert speech to text reliably",
+            "acceptance_criteria": [
+                "THE VTT_System SHALL accept WAV, MP3, FLAC, and M4A audio formats",
+                "THE VTT_System SHALL complete transcription within 2x the audio duration",
+                "THE VTT_System SHALL maintain transcription accuracy above 95% for clear audio",
+                "THE VTT_System SHALL preserve audio metadata during processing"
+            ]
+        },
+        "req_fallback_002": {
+            "title": "Engine Fallback Management",
+            "text": "THE VTT_System SHALL provide robust fallback mechanisms for transcription engines",
+            "user_story": "As a user, I want reliable transcription even when engines fail, so that my workflow is not interrupted",
+            "acceptance_criteria": [
+                "WHEN primary transcription engine fails, THE VTT_System SHALL automatically switch to secondary engine",
+                "THE VTT_System SHALL complete fallback transition within 5 seconds",
+                "THE VTT_System SHALL log all fallback events with timestamp and reason",
+                "THE VTT_System SHALL notify user of engine changes through status indicator"
+            ]
+        },
+        "req_security_003": {
+            "title": "Data Security and Privacy",
+            "text": "THE VTT_System SHALL protect user audio data and maintain privacy",
+            "user_story": "As a user, I want my audio data to be secure, so that my privacy is protected",
+            "acceptance_criteria": [
+                "THE VTT_System SHALL encrypt all temporary audio files using AES-256",
+                "THE VTT_System SHALL delete temporary files within 60 seconds of processing completion",
+                "THE VTT_System SHALL never transmit audio data to external servers",
+                "THE VTT_System SHALL audit all file access operations"
+            ]
+        },
+        "req_performance_004": {
+            "title": "Performance Optimization",
+            "text": "THE VTT_System SHALL optimize performance for different hardware configurations",
+            "user_story": "As a user, I want fast transcription, so that I can work efficiently",
+            "acceptance_criteria": [
+                "THE VTT_System SHALL utilize GPU acceleration when available",
+                "THE VTT_System SHALL process 1-minute audio in less than 30 seconds on CPU",
+                "THE VTT_System SHALL use less than 2GB RAM during transcription",
+                "THE VTT_System SHALL cache frequently used models to reduce loading time"
+            ]
+        },
+        "req_error_handling_005": {
+            "title": "Error Handling and Recovery",
+            "text": "THE VTT_System SHALL handle errors gracefully and provide recovery mechanisms",
+            "user_story": "As a user, I want clear error messages and recovery options, so that I can resolve issues quickly",
+            "acceptance_criteria": [
+                "IF audio file is corrupted, THEN THE VTT_System SHALL display specific error message",
+                "THE VTT_System SHALL provide retry mechanism for failed transcriptions",
+                "THE VTT_System SHALL maintain operation log for troubleshooting",
+                "THE VTT_System SHALL recover gracefully from memory exhaustion"
+            ]
+        }
+    }
+})
+
+@lru_cache(maxsize=1)
+def _build_suite():
+    """Build the generator and the property suite for the demo requirements once."""
+    if __package__:
+        from .core.design_property_generator import DesignPropertyGenerator
+    else:
+        from core.design_property_generator import DesignPropertyGenerator
+    generator = DesignPropertyGenerator()
+    return generator, generator.generate_properties_from_requirements(_VTT_REQUIREMENTS)
+
+def _suite_cache_key(suite, generator):
+    """Hash the exported metadata of a suite to detect unchanged artifacts."""
+    metadata = [prop.get_metadata() for prop in suite.properties]
+    payload = json.dumps([suite.name, suite.description, metadata], sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode('utf-8'))
+    # Changes to the generator's test templates invalidate the artifacts too
+    with open(sys.modules[type(generator).__module__].__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def _file_digest(file_path):
+    """Hash the current contents of an emitted artifact."""
+    return hashlib.sha1(file_path.read_bytes()).hexdigest()
+
+def _cached_artifacts(stamp_file, cache_key):
+    """
+    Return the test files recorded in ``stamp_file`` if they are still current.
+    
+    The stamp holds the cache key followed by one ``<sha1>  <name>`` line per
+    emitted file (the suite metadata first). None is returned unless the key
+    matches and every file still exists with the recorded contents.
+    """
+    if not stamp_file.exists():
+        return None
+    stamp = stamp_file.read_text(encoding='utf-8').splitlines()
+    if len(stamp) < 2 or stamp[0] != cache_key:
+        return None
+    
+    output_dir = stamp_file.parent
+    files = []
+    for line in stamp[1:]:
+        digest, _, name = line.partition('  ')
+        file_path = output_dir / name
+        if not (name and file_path.is_file() and _file_digest(file_path) == digest):
+            return None
+        files.append(file_path)
+    return files[1:]
+
 def demonstrate_property_generation():
     """Demonstrate the complete property generation workflow."""
     print("🎯 VTT Design Property Generator Demonstration")
     print("=" * 60)
     print()
     
-    # Initialize the generator
-    generator = DesignPropertyGenerator()
+    # Collect the rest of the report and write it to stdout once at the end
+    buffer = io.StringIO()
+    write = buffer.write
     
-    # Define realistic VTT requirements with acceptance criteria
-    vtt_requirements = {
-        "title": "VTT Modernization Requirements",
-        "version": "2.0.0",
-        "description": "Requirements for modernizing the VTT system with property-based testing",
-        "requirements": {
-            "req_transcription_001": {
-                "title": "Audio Transcription Processing",
-                "text": "THE VTT_System SHALL process audio transcription efficiently and accurately",
-                "user_story": "As a user, I want accurate audio transcription, so that I can convert speech to text reliably",
-                "acceptance_criteria": [
-                    "THE VTT_System SHALL accept WAV, MP3, FLAC, and M4A audio formats",
-                    "THE VTT_System SHALL complete transcription within 2x the audio duration",
-                    "THE VTT_System SHALL maintain transcription accuracy above 95% for clear audio",
-                    "THE VTT_System SHALL preserve audio metadata during processing"
-                ]
-            },
-            "req_fallback_002": {
-                "title": "Engine Fallback Management",
-                "text": "THE VTT_System SHALL provide robust fallback mechanisms for transcription engines",
-                "user_story": "As a user, I want reliable transcription even when engines fail, so that my workflow is not interrupted",
-                "acceptance_criteria": [
-                    "WHEN primary transcription engine fails, THE VTT_System SHALL automatically switch to secondary engine",
-                    "THE VTT_System SHALL complete fallback transition within 5 seconds",
-                    "THE VTT_System SHALL log all fallback events with timestamp and reason",
-                    "THE VTT_System SHALL notify user of engine changes through status indicator"
-                ]
-            },
-            "req_security_003": {
-                "title": "Data Security and Privacy",
-                "text": "THE VTT_System SHALL protect user audio data and maintain privacy",
-                "user_story": "As a user, I want my audio data to be secure, so that my privacy is protected",
-                "acceptance_criteria": [
-                    "THE VTT_System SHALL encrypt all temporary audio files using AES-256",
-                    "THE VTT_System SHALL delete temporary files within 60 seconds of processing completion",
-                    "THE VTT_System SHALL never transmit audio data to external servers",
-                    "THE VTT_System SHALL audit all file access operations"
-                ]
-            },
-            "req_performance_004": {
-                "title": "Performance Optimization",
-                "text": "THE VTT_System SHALL optimize performance for different hardware configurations",
-                "user_story": "As a user, I want fast transcription, so that I can work efficiently",
-                "acceptance_criteria": [
-                    "THE VTT_System SHALL utilize GPU acceleration when available",
-                    "THE VTT_System SHALL process 1-minute audio in less than 30 seconds on CPU",
-                    "THE VTT_System SHALL use less than 2GB RAM during transcription",
-                    "THE VTT_System SHALL cache frequently used models to reduce loading time"
-                ]
-            },
-            "req_error_handling_005": {
-                "title": "Error Handling and Recovery",
-                "text": "THE VTT_System SHALL handle errors gracefully and provide recovery mechanisms",
-                "user_story": "As a user, I want clear error messages and recovery options, so that I can resolve issues quickly",
-                "acceptance_criteria": [
-                    "IF audio file is corrupted, THEN THE VTT_System SHALL display specific error message",
-                    "THE VTT_System SHALL provide retry mechanism for failed transcriptions",
-                    "THE VTT_System SHALL maintain operation log for troubleshooting",
-                    "THE VTT_System SHALL recover gracefully from memory exhaustion"
-                ]
-            }
-        }
-    }
+    vtt_requirements = _VTT_REQUIREMENTS
     
-    print(f"📋 Processing Requirements Document: {vtt_requirements['title']}")
-    print(f"   Version: {vtt_requirements['version']}")
-    print(f"   Total Requirements: {len(vtt_requirements['requirements'])}")
-    print()
+    write(f"📋 Processing Requirements Document: {vtt_requirements['title']}\n")
+    write(f"   Version: {vtt_requirements['version']}\n")
+    write(f"   Total Requirements: {len(vtt_requirements['requirements'])}\n")
+    write("\n")
     
     # Generate property suite
-    print("🔄 Generating Property Suite...")
-    suite = generator.generate_properties_from_requirements(vtt_requirements)
+    write("🔄 Generating Property Suite...\n")
+    # The generator and suite are reused by later runs; both are only read below
+    generator, suite = _build_suite()
     
-    print(f"✅ Generated Property Suite: {suite.name}")
-    print(f"   Description: {suite.description}")
-    print(f"   Total Properties: {len(suite.properties)}")
-    print(f"   Enabled Properties: {len(suite.get_enabled_properties())}")
-    print()
+    write(f"✅ Generated Property Suite: {suite.name}\n")
+    write(f"   Description: {suite.description}\n")
+    write(f"   Total Properties: {len(suite.properties)}\n")
+    write(f"   Enabled Properties: {suite.enabled_count}\n")
+    write("\n")
     
     # Analyze and display generated properties
-    print("📊 Generated Properties Analysis:")
-    print("-" * 40)
-    
-    property_types = {}
-    testability_levels = {}
+    write("📊 Generated Properties Analysis:\n")
+    write("-" * 40 + "\n")
     
     for i, prop in enumerate(suite.properties, 1):
-        print(f"{i:2d}. {prop.name}")
-        print(f"    📝 Description: {prop.description[:80]}...")
-        print(f"    🏷️  Type: {prop.property_type.value}")
-        print(f"    🔗 Requirements Ref: {prop.requirements_reference}")
-        print(f"    ✅ Validation: {prop.validation_criteria.criteria_type.value}")
-        print(f"    ⚡ Priority: {prop.priority}")
-        print(f"    🏃 Enabled: {prop.enabled}")
-        print()
-        
-        # Collect statistics
-        prop_type = prop.property_type.value
-        property_types[prop_type] = property_types.get(prop_type, 0) + 1
+        write(
+            f"{i:2d}. {prop.name}\n"
+            f"    📝 Description: {prop.short_description}...\n"
+            f"    🏷️  Type: {prop.property_type.value}\n"
+            f"    🔗 Requirements Ref: {prop.requirements_reference}\n"
+            f"    ✅ Validation: {prop.validation_criteria.criteria_type.value}\n"
+            f"    ⚡ Priority: {prop.priority}\n"
+            f"    🏃 Enabled: {prop.enabled}\n"
+            "\n"
+        )
+    
+    # Collect statistics
+    property_types = Counter(prop.property_type.value for prop in suite.properties)
     
     # Display statistics
-    print("📈 Property Generation Statistics:")
-    print("-" * 30)
-    print(f"Total Properties Generated: {len(suite.properties)}")
-    print("Property Types Distribution:")
-    for prop_type, count in property_types.items():
-        print(f"  • {prop_type}: {count}")
-    print()
+    write("📈 Property Generation Statistics:\n")
+    write("-" * 30 + "\n")
+    write(f"Total Properties Generated: {len(suite.properties)}\n")
+    write("Property Types Distribution:\n")
+    write("".join(f"  • {prop_type}: {count}\n" for prop_type, count in property_types.items()))
+    write("\n")
     
     # Demonstrate property-to-test mapping
-    print("🧪 Property-to-Test Mapping Examples:")
-    print("-" * 40)
+    write("🧪 Property-to-Test Mapping Examples:\n")
+    write("-" * 40 + "\n")
     
     # Show first few properties with their test mapping details
     for i, prop in enumerate(suite.properties[:3], 1):
-        print(f"Example {i}: {prop.name}")
-        print(f"  Original Criterion: {prop.description}")
-        print(f"  Test Strategy: Property-based testing with {prop.property_type.value}")
-        print(f"  Validation Approach: {prop.validation_criteria.criteria_type.value}")
+        criteria = prop.validation_criteria
+        criteria_type = criteria.criteria_type.value
+        write(
+            f"Example {i}: {prop.name}\n"
+            f"  Original Criterion: {prop.description}\n"
+            f"  Test Strategy: Property-based testing with {prop.property_type.value}\n"
+            f"  Validation Approach: {criteria_type}\n"
+        )
         
-        if prop.validation_criteria.criteria_type.value == "numeric_range":
-            if prop.validation_criteria.max_value:
-                print(f"  Expected Range: ≤ {prop.validation_criteria.max_value}")
-        elif prop.validation_criteria.criteria_type.value == "boolean":
-            print(f"  Expected Result: {prop.validation_criteria.expected_value}")
+        if criteria_type == "numeric_range":
+            if criteria.max_value:
+                write(f"  Expected Range: ≤ {criteria.max_value}\n")
+        elif criteria_type == "boolean":
+            write(f"  Expected Result: {criteria.expected_value}\n")
         
-        print(f"  Test Function: Callable = {callable(prop.test_function)}")
-        print()
+        write(f"  Test Function: Callable = {callable(prop.test_function)}\n")
+        write("\n")
     
     # Export property suite for further use
+    from pathlib import Path
     output_dir = Path("generated_properties")
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Export suite metadata
+    # Skip rewriting artifacts that a previous run produced for the same suite
+    # and generator, as long as nobody has changed them since
     suite_file = output_dir / "property_suite.json"
-    success = generator.export_property_suite(suite, suite_file)
+    stamp_file = output_dir / ".cache_key"
+    cache_key = _suite_cache_key(suite, generator)
+    test_files = _cached_artifacts(stamp_file, cache_key)
+    cache_hit = test_files is not None
     
-    if success:
-        print(f"💾 Property suite exported to: {suite_file}")
-    
-    # Generate test code files
-    test_files = generator.generate_test_code_files(suite, output_dir)
+    if cache_hit:
+        success = True
+    else:
+        # Export suite metadata and test code files in one pass
+        success, test_files = generator.export_all(suite, output_dir)
+        
+        if success and test_files:
+            stamp_file.write_text(
+                '\n'.join([cache_key] + [f"{_file_digest(file_path)}  {file_path.name}"
+                                          for file_path in [suite_file] + test_files]),
+                encoding='utf-8'
+            )
     
-    if test_files:
-        print(f"🧪 Generated {len(test_files)} test code files:")
-        for file_path in test_files:
-            print(f"   • {file_path}")
+    if cache_hit:
+        write(f"💾 Property suite up to date: {suite_file}\n")
+        write(f"♻️ Reusing {len(test_files)} cached test code files:\n")
+    else:
+        if success:
+            write(f"💾 Property suite exported to: {suite_file}\n")
+        if test_files:
+            write(f"🧪 Generated {len(test_files)} test code files:\n")
+    for file_path in test_files:
+        write(f"   • {file_path}\n")
     
-    print()
+    write("\n")
     
     # Demonstrate correctness properties validation
-    print("✅ Correctness Properties Validation:")
-    print("-" * 40)
+    write("✅ Correctness Properties Validation:\n")
+    write("-" * 40 + "\n")
     
-    # Check Requirements 1.4: Universally quantified and testable properties
-    universally_quantified = all(callable(prop.test_function) for prop in suite.properties)
-    testable_properties = all(prop.enabled and prop.validation_criteria for prop in suite.properties)
+    # Check Requirements 1.4 and 1.5 in a single pass over the properties
+    universally_quantified = testable_properties = comprehensive_docs = traceability = True
+    for prop in suite.properties:
+        if not callable(prop.test_function):
+            universally_quantified = False
+        if not (prop.enabled and prop.validation_criteria):
+            testable_properties = False
+        reference = prop.requirements_reference
+        if not (prop.name and prop.description and reference):
+            comprehensive_docs = False
+        if not reference:
+            traceability = False
     
-    print(f"Requirement 1.4 - Universally Quantified Properties: {'✅' if universally_quantified else '❌'}")
-    print(f"  • All properties have callable test functions: {universally_quantified}")
-    print(f"  • All properties are testable: {testable_properties}")
+    # Requirements 1.4: Universally quantified and testable properties
+    write(f"Requirement 1.4 - Universally Quantified Properties: {'✅' if universally_quantified else '❌'}\n")
+    write(f"  • All properties have callable test functions: {universally_quantified}\n")
+    write(f"  • All properties are testable: {testable_properties}\n")
     
-    # Check Requirements 1.5: Comprehensive documentation
-    comprehensive_docs = all(
-        prop.name and prop.description and prop.requirements_reference 
-        for prop in suite.properties
-    )
-    traceability = all(prop.requirements_reference for prop in suite.properties)
+    # Requirements 1.5: Comprehensive documentation
+    write(f"Requirement 1.5 - Comprehensive Documentation: {'✅' if comprehensive_docs else '❌'}\n")
+    write(f"  • All properties have complete documentation: {comprehensive_docs}\n")
+    write(f"  • Requirements traceability maintained: {traceability}\n")
     
-    print(f"Requirement 1.5 - Comprehensive Documentation: {'✅' if comprehensive_docs else '❌'}")
-    print(f"  • All properties have complete documentation: {comprehensive_docs}")
-    print(f"  • Requirements traceability maintained: {traceability}")
+    write("\n")
+    write("🎉 Design Property Generator Demonstration Complete!\n")
+    write("\n")
+    write("📋 Task 2.3 Implementation Summary:\n")
+    write("   ✅ Acceptance criteria analyzer - Analyzes criteria for testability and complexity\n")
+    write("   ✅ Property template system - Provides templates for different property types\n")
+    write("   ✅ Property-to-test mapping - Maps acceptance criteria to concrete test implementations\n")
+    write("   ✅ Correctness properties - Generates universally quantified, testable properties\n")
+    write("   ✅ Comprehensive documentation - Maintains traceability following spec format\n")
+    write("\n")
+    write("🎯 Requirements 1.4 and 1.5 successfully implemented!\n")
     
-    print()
-    print("🎉 Design Property Generator Demonstration Complete!")
-    print()
-    print("📋 Task 2.3 Implementation Summary:")
-    print("   ✅ Acceptance criteria analyzer - Analyzes criteria for testability and complexity")
-    print("   ✅ Property template system - Provides templates for different property types")
-    print("   ✅ Property-to-test mapping - Maps acceptance criteria to concrete test implementations")
-    print("   ✅ Correctness properties - Generates universally quantified, testable properties")
-    print("   ✅ Comprehensive documentation - Maintains traceability following spec format")
-    print()
-    print("🎯 Requirements 1.4 and 1.5 successfully implemented!")
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     demonstrate_property_generation()
\ No newline at end of file
@@ -5,7 +5,8 @@ This module contains enhanced versions of existing VTT components that provide
 improved functionality while maintaining backward compatibility.
 """
 
-from .fallback_manager import EnhancedFallbackManager
+# Components are imported on first attribute access (PEP 562), so importing the
+# package does not pay for the fallback manager until it is actually used.
 # from .mcp_interface import MCPInterface  # TODO: Implement in future tasks
 # from .performance_monitor import PerformanceMonitor  # TODO: Implement in future tasks
 
@@ -13,4 +14,16 @@ __all__ = [
     'EnhancedFallbackManager',
     # 'MCPInterface',
     # 'PerformanceMonitor'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name == 'EnhancedFallbackManager':
+        from .fallback_manager import EnhancedFallbackManager
+        globals()[name] = EnhancedFallbackManager
+        return EnhancedFallbackManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,18 +5,43 @@ This module provides an improved fallback system with better monitoring,
 recovery mechanisms, and performance analytics for transcription engines.
 """
 
+import asyncio
+import bisect
 import logging
-from typing import Dict, List, Any, Optional, Callable
+from typing import Deque, Dict, List, Any, Optional, Callable, NamedTuple, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import time
+import random
 import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, groupby
+from operator import itemgetter
 import numpy as np
 
+try:
+    import psutil
+except ImportError:
+    # Optional dependency, system metrics fall back to mock readings otherwise
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
 
+def _append_windowed(window: deque, value: float, running_sum: float) -> float:
+    """
+    Append ``value`` to a bounded window and return the updated window sum.
+    
+    The element evicted by a full window is subtracted so the sum stays
+    O(1) to maintain instead of being recomputed over the whole window.
+    """
+    if len(window) == window.maxlen:
+        running_sum -= window[0]
+    window.append(value)
+    return running_sum + value
+
+
 class EngineStatus(Enum):
     """Status of transcription engines."""
     HEALTHY = "healthy"
@@ -35,7 +60,15 @@ class FallbackReason(Enum):
     RESOURCE_EXHAUSTION = "resource_exhaustion"
 
 
-@dataclass
+# Keywords mapping a free-text fallback reason to its enum, checked in priority order
+_FALLBACK_REASON_KEYWORDS = (
+    ('performance', FallbackReason.PERFORMANCE_DEGRADATION),
+    ('timeout', FallbackReason.TIMEOUT),
+    ('quality', FallbackReason.QUALITY_THRESHOLD),
+)
+
+
+@dataclass(slots=True)
 class EngineMetrics:
     """Performance metrics for a transcription engine."""
     engine_name: str
@@ -48,9 +81,21 @@ class EngineMetrics:
     status: EngineStatus = EngineStatus.HEALTHY
     recent_latencies: deque = field(default_factory=lambda: deque(maxlen=100))
     recent_qualities: deque = field(default_factory=lambda: deque(maxlen=100))
+    running_latency_sum: float = 0.0
+    running_quality_sum: float = 0.0
+    # Guards this engine's counters so engines are updated independently
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+class FallbackEvent(NamedTuple):
+    """A recorded fallback event, kept compact in the bounded history."""
+    timestamp: float
+    engine_name: str
+    reason: str
+    details: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Overall health status of the fallback system."""
     healthy_engines: int
@@ -62,7 +107,7 @@ class HealthStatus:
     recommendations: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionEngine:
     """Represents a transcription engine."""
     name: str
@@ -75,7 +120,7 @@ class TranscriptionEngine:
     quality_threshold: float = 0.7
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioData:
     """Audio data container."""
     samples: np.ndarray
@@ -84,7 +129,7 @@ class AudioData:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Result of transcription operation."""
     text: str
@@ -115,7 +160,8 @@ class EnhancedFallbackManager:
         self.config = config or {}
         self.engines: Dict[str, TranscriptionEngine] = {}
         self.metrics: Dict[str, EngineMetrics] = {}
-        self.fallback_history: List[Dict[str, Any]] = []
+        # Bounded history, appended and snapshotted under the manager lock
+        self.fallback_history: Deque[FallbackEvent] = deque(maxlen=1000)
         
         # Configuration parameters
         self.max_fallback_attempts = self.config.get('max_fallback_attempts', 3)
@@ -123,14 +169,34 @@ class EnhancedFallbackManager:
         self.performance_window = self.config.get('performance_window', 300.0)  # 5 minutes
         self.quality_threshold = self.config.get('quality_threshold', 0.7)
         self.latency_threshold = self.config.get('latency_threshold', 5.0)  # seconds
+        self.batch_max_workers = self.config.get('batch_max_workers')  # None = executor default
+        self.system_metrics_ttl = self.config.get('system_metrics_ttl', 1.0)  # seconds
+        
+        # Last system reading as (monotonic timestamp, load, memory usage)
+        self._sysload_cache: Tuple[float, float, float] = (float('-inf'), 0.0, 0.0)
+        if psutil is not None:
+            # The first non-blocking reading is always 0.0; prime the CPU counters
+            psutil.cpu_percent(interval=None)
         
         # Monitoring thread
         self._monitoring_active = False
+        # Set to wake the monitoring thread immediately on shutdown
+        self._stop_event = threading.Event()
         self._monitoring_thread: Optional[threading.Thread] = None
         
-        # Thread safety
+        # Thread safety: the manager lock guards structural changes (engine
+        # registration); per-engine metrics carry their own lock
         self._lock = threading.RLock()
         
+        # Sorted available engines, reused until the engine set or a status changes.
+        # Versions come from an atomic counter so concurrent bumps are never lost.
+        self._version_counter = count(1)
+        self._engines_version = 0
+        # Registered engines as (priority, registration order, name), kept sorted on insert
+        self._sorted_engines: List[Tuple[int, int, str]] = []
+        self._registration_counter = count()
+        self._cached_available: Optional[Tuple[Any, List[TranscriptionEngine]]] = None
+        
         logger.info("Enhanced Fallback Manager initialized")
     
     def register_engine(self, engine: TranscriptionEngine, priority: int) -> None:
@@ -142,9 +208,19 @@ class EnhancedFallbackManager:
             priority: Priority level (lower numbers = higher priority)
         """
         with self._lock:
+            # Re-registering keeps the engine's original registration order
+            order = next(self._registration_counter)
+            previous = self.engines.get(engine.name)
+            if previous is not None:
+                entry = next(e for e in self._sorted_engines if e[2] == engine.name)
+                self._sorted_engines.remove(entry)
+                order = entry[1]
+            
             engine.priority = priority
             self.engines[engine.name] = engine
+            bisect.insort(self._sorted_engines, (priority, order, engine.name))
             self.metrics[engine.name] = EngineMetrics(engine_name=engine.name)
+            self._engines_version = next(self._version_counter)
             
             logger.info(f"Registered engine: {engine.name} with priority {priority}")
     
@@ -160,8 +236,10 @@ class EnhancedFallbackManager:
         """
         with self._lock:
             if engine_name in self.engines:
+                self._sorted_engines = [e for e in self._sorted_engines if e[2] != engine_name]
                 del self.engines[engine_name]
                 del self.metrics[engine_name]
+                self._engines_version = next(self._version_counter)
                 logger.info(f"Unregistered engine: {engine_name}")
                 return True
             
@@ -183,53 +261,117 @@ class EnhancedFallbackManager:
         with self._lock:
             # Get sorted engines by priority and health
             available_engines = self._get_available_engines()
+        
+        return self._attempt_with_engines(available_engines, audio)
+    
+    def attempt_transcription_batch(self, audios: List[AudioData]) -> List[TranscriptionResult]:
+        """
+        Attempt transcription of several audio chunks with automatic fallback.
+        
+        The engine order is snapshotted once for the whole batch, audio
+        durations are computed in a single vectorized pass, and the chunks
+        are transcribed concurrently on a thread pool.
+        
+        Args:
+            audios: AudioData chunks to transcribe
             
-            if not available_engines:
-                logger.error("No available engines for transcription")
-                return TranscriptionResult(
-                    text="",
-                    confidence=0.0,
-                    engine_used="none",
-                    processing_time=0.0,
-                    quality_score=0.0,
-                    success=False,
-                    error_message="No available transcription engines"
-                )
+        Returns:
+            TranscriptionResults in the same order as ``audios``
+        """
+        if not audios:
+            return []
+        
+        lengths = np.fromiter((len(audio.samples) for audio in audios), dtype=np.float64, count=len(audios))
+        rates = np.fromiter((audio.sample_rate for audio in audios), dtype=np.float64, count=len(audios))
+        # Chunks with a non-positive rate are rejected before their duration is used
+        durations = np.divide(lengths, rates, out=np.zeros_like(lengths), where=rates > 0)
+        
+        with self._lock:
+            available_engines = self._get_available_engines()
+        
+        with ThreadPoolExecutor(max_workers=self.batch_max_workers,
+                                thread_name_prefix="fallback_batch") as executor:
+            return list(executor.map(
+                lambda audio, duration: self._attempt_with_engines(available_engines, audio, duration),
+                audios, durations.tolist()
+            ))
+    
+    async def attempt_transcription_async(self, audio: AudioData) -> TranscriptionResult:
+        """
+        Attempt transcription with automatic fallback without blocking the event loop.
+        
+        Runs ``attempt_transcription`` on a worker thread via ``asyncio.to_thread``,
+        so the sync and async paths share one fallback loop.
+        
+        Args:
+            audio: AudioData to transcribe
             
-            # Attempt transcription with each engine
-            for attempt, engine in enumerate(available_engines):
-                if attempt >= self.max_fallback_attempts:
-                    logger.warning(f"Maximum fallback attempts ({self.max_fallback_attempts}) reached")
-                    break
-                
-                try:
-                    logger.debug(f"Attempting transcription with engine: {engine.name}")
-                    result = self._transcribe_with_engine(engine, audio)
-                    
-                    if result.success:
-                        self._update_engine_metrics(engine.name, result, True)
-                        logger.info(f"Transcription successful with engine: {engine.name}")
-                        return result
-                    else:
-                        self._update_engine_metrics(engine.name, result, False)
-                        self._record_fallback_event(engine.name, FallbackReason.ENGINE_FAILURE, result.error_message)
-                        
-                except Exception as e:
-                    logger.error(f"Engine {engine.name} failed: {e}", exc_info=True)
-                    self._update_engine_status(engine.name, EngineStatus.FAILED)
-                    self._record_fallback_event(engine.name, FallbackReason.ENGINE_FAILURE, str(e))
+        Returns:
+            TranscriptionResult with transcription and metadata
+        """
+        return await asyncio.to_thread(self.attempt_transcription, audio)
+    
+    def _attempt_with_engines(self, available_engines: List[TranscriptionEngine], audio: AudioData,
+                              audio_duration: Optional[float] = None) -> TranscriptionResult:
+        """Try ``available_engines`` in order until one transcribes ``audio``."""
+        if audio.sample_rate <= 0:
+            logger.error(f"Invalid sample rate: {audio.sample_rate}")
+            return self._failed_transcription(f"Invalid sample rate: {audio.sample_rate}")
+        
+        if not available_engines:
+            logger.error("No available engines for transcription")
+            return self._failed_transcription("No available transcription engines")
+        
+        # Engine calls run outside the manager lock so concurrent requests
+        # only contend on the metrics of the engine they actually use
+        for attempt, engine in enumerate(available_engines):
+            if attempt >= self.max_fallback_attempts:
+                logger.warning(f"Maximum fallback attempts ({self.max_fallback_attempts}) reached")
+                break
             
-            # All engines failed
-            logger.error("All transcription engines failed")
-            return TranscriptionResult(
-                text="",
-                confidence=0.0,
-                engine_used="none",
-                processing_time=0.0,
-                quality_score=0.0,
-                success=False,
-                error_message="All transcription engines failed"
-            )
+            try:
+                logger.debug(f"Attempting transcription with engine: {engine.name}")
+                result = self._transcribe_with_engine(engine, audio, audio_duration)
+                if self._record_engine_outcome(engine, result):
+                    return result
+            except Exception as e:
+                self._record_engine_exception(engine, e)
+        
+        # All engines failed
+        logger.error("All transcription engines failed")
+        return self._failed_transcription("All transcription engines failed")
+    
+    def _record_engine_outcome(self, engine: TranscriptionEngine, result: TranscriptionResult) -> bool:
+        """Update metrics for an engine attempt and return True if it succeeded."""
+        engine_name = engine.name
+        metrics = self.metrics.get(engine_name)
+        if result.success:
+            self._update_engine_metrics(metrics, result, True)
+            logger.info(f"Transcription successful with engine: {engine_name}")
+            return True
+        
+        self._update_engine_metrics(metrics, result, False)
+        self._record_fallback_event(engine_name, FallbackReason.ENGINE_FAILURE, result.error_message)
+        return False
+    
+    def _record_engine_exception(self, engine: TranscriptionEngine, error: Exception) -> None:
+        """Mark an engine as failed after an unexpected exception."""
+        logger.error(f"Engine {engine.name} failed: {error}", exc_info=True)
+        self._update_engine_status(engine.name, EngineStatus.FAILED)
+        self._record_fallback_event(engine.name, FallbackReason.ENGINE_FAILURE, str(error))
+    
+    @staticmethod
+    def _failed_transcription(error_message: str) -> TranscriptionResult:
+        """Build the result returned when no engine produced a transcription."""
+        return TranscriptionResult(
+            text="",
+            confidence=0.0,
+            engine_used="none",
+            processing_time=0.0,
+            quality_score=0.0,
+            success=False,
+            error_message=error_message
+        )
     
     def monitor_engine_health(self) -> HealthStatus:
         """
@@ -299,13 +441,11 @@ class EnhancedFallbackManager:
                 self._update_engine_status(failed_engine, EngineStatus.FAILED)
                 
                 # Determine fallback reason enum
-                fallback_reason = FallbackReason.ENGINE_FAILURE
-                if 'performance' in reason.lower():
-                    fallback_reason = FallbackReason.PERFORMANCE_DEGRADATION
-                elif 'timeout' in reason.lower():
-                    fallback_reason = FallbackReason.TIMEOUT
-                elif 'quality' in reason.lower():
-                    fallback_reason = FallbackReason.QUALITY_THRESHOLD
+                reason_lower = reason.lower()
+                fallback_reason = next(
+                    (value for keyword, value in _FALLBACK_REASON_KEYWORDS if keyword in reason_lower),
+                    FallbackReason.ENGINE_FAILURE
+                )
                 
                 self._record_fallback_event(failed_engine, fallback_reason, reason)
                 return True
@@ -320,6 +460,7 @@ class EnhancedFallbackManager:
             return
         
         self._monitoring_active = True
+        self._stop_event.clear()
         self._monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self._monitoring_thread.start()
         
@@ -331,6 +472,7 @@ class EnhancedFallbackManager:
             return
         
         self._monitoring_active = False
+        self._stop_event.set()
         if self._monitoring_thread:
             self._monitoring_thread.join(timeout=5.0)
         
@@ -359,137 +501,164 @@ class EnhancedFallbackManager:
             limit: Maximum number of events to return
             
         Returns:
-            List of fallback events
+            List of fallback events as dictionaries
         """
         with self._lock:
-            history = self.fallback_history.copy()
-            if limit:
-                history = history[-limit:]
-            return history
+            events = list(self.fallback_history)
+        if limit:
+            events = events[-limit:]
+        return [event._asdict() for event in events]
     
     def _get_available_engines(self) -> List[TranscriptionEngine]:
-        """Get available engines sorted by priority and health."""
+        """
+        Get available engines sorted by priority and health.
+        
+        The sorted list is cached and rebuilt only when an engine is
+        registered or unregistered, an engine status changes, or an
+        engine's ``enabled`` flag is toggled, so health-based ordering
+        between engines of equal priority refreshes on status changes.
+        """
+        cache_key = (self._engines_version, tuple(engine.enabled for engine in self.engines.values()))
+        if self._cached_available is not None and self._cached_available[0] == cache_key:
+            return list(self._cached_available[1])
+        
         available = []
         
-        for engine in self.engines.values():
-            if not engine.enabled:
-                continue
+        # Engines are kept in priority order (lower number = higher priority), so
+        # only engines sharing a priority need sorting, by health
+        for _, group in groupby(self._sorted_engines, key=itemgetter(0)):
+            candidates = []
+            for _, _, engine_name in group:
+                engine = self.engines[engine_name]
+                if not engine.enabled:
+                    continue
+                
+                metrics = self.metrics[engine_name]
+                if metrics.status in [EngineStatus.HEALTHY, EngineStatus.DEGRADED, EngineStatus.RECOVERING]:
+                    candidates.append(engine)
             
-            metrics = self.metrics[engine.name]
-            if metrics.status in [EngineStatus.HEALTHY, EngineStatus.DEGRADED, EngineStatus.RECOVERING]:
-                available.append(engine)
+            if len(candidates) > 1:
+                candidates.sort(key=lambda e: self._get_engine_health_score(e.name))
+            available.extend(candidates)
         
-        # Sort by priority (lower number = higher priority) and then by health
-        available.sort(key=lambda e: (e.priority, self._get_engine_health_score(e.name)))
-        
-        return available
+        self._cached_available = (cache_key, available)
+        return list(available)
     
-    def _transcribe_with_engine(self, engine: TranscriptionEngine, audio: AudioData) -> TranscriptionResult:
+    def _transcribe_with_engine(self, engine: TranscriptionEngine, audio: AudioData,
+                                audio_duration: Optional[float] = None) -> TranscriptionResult:
         """Transcribe audio with a specific engine."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Call the engine's transcription function
             result_text = engine.engine_callable(audio.samples, audio.sample_rate)
-            
-            end_time = time.time()
-            processing_time = end_time - start_time
-            
-            # Calculate quality score (mock implementation)
-            quality_score = self._calculate_quality_score(result_text, audio)
-            
-            # Check if result meets quality threshold
-            if quality_score < engine.quality_threshold:
-                return TranscriptionResult(
-                    text=result_text,
-                    confidence=quality_score,
-                    engine_used=engine.name,
-                    processing_time=processing_time,
-                    quality_score=quality_score,
-                    success=False,
-                    error_message=f"Quality score {quality_score} below threshold {engine.quality_threshold}"
-                )
-            
+            return self._engine_result(engine, audio, result_text, time.perf_counter() - start_time, audio_duration)
+        except Exception as e:
+            return self._engine_error_result(engine, e, time.perf_counter() - start_time)
+    
+    def _engine_result(self, engine: TranscriptionEngine, audio: AudioData, result_text: str,
+                       processing_time: float, audio_duration: Optional[float] = None) -> TranscriptionResult:
+        """Score an engine's output and build its TranscriptionResult."""
+        # Calculate quality score (mock implementation)
+        if audio_duration is None:
+            audio_duration = len(audio.samples) / audio.sample_rate
+        quality_score = self._calculate_quality_score(result_text, audio_duration)
+        
+        # Check if result meets quality threshold
+        if quality_score < engine.quality_threshold:
             return TranscriptionResult(
                 text=result_text,
                 confidence=quality_score,
                 engine_used=engine.name,
                 processing_time=processing_time,
                 quality_score=quality_score,
-                success=True
-            )
-            
-        except Exception as e:
-            end_time = time.time()
-            processing_time = end_time - start_time
-            
-            return TranscriptionResult(
-                text="",
-                confidence=0.0,
-                engine_used=engine.name,
-                processing_time=processing_time,
-                quality_score=0.0,
                 success=False,
-                error_message=str(e)
+                error_message=f"Quality score {quality_score} below threshold {engine.quality_threshold}"
             )
+        
+        return TranscriptionResult(
+            text=result_text,
+            confidence=quality_score,
+            engine_used=engine.name,
+            processing_time=processing_time,
+            quality_score=quality_score,
+            success=True
+        )
     
-    def _update_engine_metrics(self, engine_name: str, result: TranscriptionResult, success: bool) -> None:
-        """Update performance metrics for an engine."""
-        if engine_name not in self.metrics:
-            return
+    @staticmethod
+    def _engine_error_result(engine: TranscriptionEngine, error: Exception,
+                             processing_time: float) -> TranscriptionResult:
+        """Build the failed TranscriptionResult for an engine call that raised."""
+        return TranscriptionResult(
+            text="",
+            confidence=0.0,
+            engine_used=engine.name,
+            processing_time=processing_time,
+            quality_score=0.0,
+            success=False,
+            error_message=str(error)
+        )
+    
+    def _update_engine_metrics(self, metrics: Optional[EngineMetrics], result: TranscriptionResult,
+                               success: bool) -> None:
+        """
+        Update performance metrics for an engine.
         
-        metrics = self.metrics[engine_name]
-        metrics.total_requests += 1
-        metrics.last_used = time.time()
+        Takes the engine's EngineMetrics directly, as looked up once by the
+        caller; ``None`` (an engine unregistered mid-attempt) is ignored.
+        """
+        if metrics is None:
+            return
         
-        if success:
-            metrics.successful_requests += 1
-            metrics.recent_latencies.append(result.processing_time)
-            metrics.recent_qualities.append(result.quality_score)
-            
-            # Update averages
-            if metrics.recent_latencies:
-                metrics.average_latency = sum(metrics.recent_latencies) / len(metrics.recent_latencies)
-            if metrics.recent_qualities:
-                metrics.average_quality = sum(metrics.recent_qualities) / len(metrics.recent_qualities)
+        with metrics._lock:
+            previous_status = metrics.status
+            metrics.total_requests += 1
+            metrics.last_used = time.time()
             
-            # Update status based on performance
-            if metrics.average_latency > self.latency_threshold:
-                metrics.status = EngineStatus.DEGRADED
-            elif metrics.average_quality < self.quality_threshold:
-                metrics.status = EngineStatus.DEGRADED
+            if success:
+                metrics.successful_requests += 1
+                metrics.running_latency_sum = _append_windowed(
+                    metrics.recent_latencies, result.processing_time, metrics.running_latency_sum)
+                metrics.running_quality_sum = _append_windowed(
+                    metrics.recent_qualities, result.quality_score, metrics.running_quality_sum)
+                
+                # Update averages from the running window sums
+                metrics.average_latency = metrics.running_latency_sum / len(metrics.recent_latencies)
+                metrics.average_quality = metrics.running_quality_sum / len(metrics.recent_qualities)
+                
+                # Update status based on performance
+                if metrics.average_latency > self.latency_threshold:
+                    metrics.status = EngineStatus.DEGRADED
+                elif metrics.average_quality < self.quality_threshold:
+                    metrics.status = EngineStatus.DEGRADED
+                else:
+                    metrics.status = EngineStatus.HEALTHY
             else:
-                metrics.status = EngineStatus.HEALTHY
-        else:
-            metrics.failed_requests += 1
+                metrics.failed_requests += 1
+                
+                # Check failure rate (> 50% failed, > 20% degraded) without a float division
+                failed, total = metrics.failed_requests, metrics.total_requests
+                if failed * 2 > total:
+                    metrics.status = EngineStatus.FAILED
+                elif failed * 5 > total:
+                    metrics.status = EngineStatus.DEGRADED
             
-            # Check failure rate
-            failure_rate = metrics.failed_requests / metrics.total_requests
-            if failure_rate > 0.5:
-                metrics.status = EngineStatus.FAILED
-            elif failure_rate > 0.2:
-                metrics.status = EngineStatus.DEGRADED
+            if metrics.status != previous_status:
+                self._engines_version = next(self._version_counter)
     
     def _update_engine_status(self, engine_name: str, status: EngineStatus) -> None:
         """Update the status of an engine."""
-        if engine_name in self.metrics:
-            self.metrics[engine_name].status = status
+        metrics = self.metrics.get(engine_name)
+        if metrics is not None:
+            with metrics._lock:
+                metrics.status = status
+            self._engines_version = next(self._version_counter)
             logger.debug(f"Engine {engine_name} status updated to: {status.value}")
     
     def _record_fallback_event(self, engine_name: str, reason: FallbackReason, details: str) -> None:
         """Record a fallback event for analytics."""
-        event = {
-            'timestamp': time.time(),
-            'engine_name': engine_name,
-            'reason': reason.value,
-            'details': details
-        }
-        
-        self.fallback_history.append(event)
-        
-        # Keep history limited
-        if len(self.fallback_history) > 1000:
-            self.fallback_history = self.fallback_history[-500:]
+        with self._lock:
+            self.fallback_history.append(FallbackEvent(time.time(), engine_name, reason.value, details))
         
         logger.info(f"Fallback event recorded: {engine_name} - {reason.value}")
     
@@ -512,7 +681,7 @@ class EnhancedFallbackManager:
         
         return health_score
     
-    def _calculate_quality_score(self, text: str, audio: AudioData) -> float:
+    def _calculate_quality_score(self, text: str, audio_duration: float) -> float:
         """Calculate quality score for transcription result."""
         # Mock implementation - would use actual quality metrics
         if not text:
@@ -520,29 +689,48 @@ class EnhancedFallbackManager:
         
         # Simple heuristics
         score = 0.8  # Base score
-        
-        # Penalize very short results for long audio
-        audio_duration = len(audio.samples) / audio.sample_rate
-        if audio_duration > 1.0 and len(text) < 10:
-            score -= 0.3
-        
-        # Reward reasonable text length
-        if 10 <= len(text) <= 1000:
+        text_length = len(text)
+        
+        if text_length < 10:
+            # Penalize very short results for long audio
+            if audio_duration > 1.0:
+                score -= 0.3
+        elif text_length <= 1000:
+            # Reward reasonable text length
             score += 0.1
         
         return min(1.0, max(0.0, score))
     
     def _calculate_system_load(self) -> float:
-        """Calculate current system load."""
-        # Mock implementation - would use actual system metrics
-        import random
-        return random.uniform(0.1, 0.9)
+        """Calculate current system load (0.0 - 1.0)."""
+        return self._sample_system_metrics()[0]
     
     def _calculate_memory_usage(self) -> float:
-        """Calculate current memory usage."""
-        # Mock implementation - would use actual memory metrics
-        import random
-        return random.uniform(0.2, 0.8)
+        """Calculate current memory usage (0.0 - 1.0)."""
+        return self._sample_system_metrics()[1]
+    
+    def _sample_system_metrics(self) -> Tuple[float, float]:
+        """
+        Return (system load, memory usage), sampled at most once per TTL.
+        
+        Health checks running in quick succession reuse the cached reading
+        instead of querying the operating system each time.
+        """
+        timestamp, load, memory = self._sysload_cache
+        now = time.monotonic()
+        if now - timestamp < self.system_metrics_ttl:
+            return load, memory
+        
+        if psutil is not None:
+            load = psutil.cpu_percent(interval=None) / 100.0
+            memory = psutil.virtual_memory().percent / 100.0
+        else:
+            # Mock implementation - psutil is not installed
+            load = random.uniform(0.1, 0.9)
+            memory = random.uniform(0.2, 0.8)
+        
+        self._sysload_cache = (now, load, memory)
+        return load, memory
     
     def _monitoring_loop(self) -> None:
         """Background monitoring loop."""
@@ -557,9 +745,9 @@ class EnhancedFallbackManager:
                                  f"{health_status.degraded_engines} degraded, "
                                  f"{health_status.failed_engines} failed")
                 
-                # Sleep until next check
-                time.sleep(self.health_check_interval)
-                
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}", exc_info=True)
-                time.sleep(self.health_check_interval)
\ No newline at end of file
+            
+            # Wait until next check, returning early when monitoring is stopped
+            if self._stop_event.wait(self.health_check_interval):
+                break
\ No newline at end of file
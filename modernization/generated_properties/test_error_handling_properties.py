@@ -1,92 +0,0 @@
-"""
-Generated property tests for error_handling properties.
-
-This file contains property-based tests generated from acceptance criteria.
-"""
-
-import pytest
-from hypothesis import given, strategies as st
-import time
-from typing import Any
-
-# Import VTT modernization components
-from whisper.modernization.models.property_models import PropertyTestResult
-from whisper.modernization.core.property_testing import PropertyTestFramework
-
-
-class TestError_HandlingProperties:
-    """Test class for error_handling properties."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_framework = PropertyTestFramework()
-    
-
-    def test_audio_file_corrupted_req_error_handling_005(self):
-        """
-        Property test for: IF audio file is corrupted, THEN THE VTT_System SHALL display specific error message...
-        
-        Requirements reference: req_error_handling_005
-        Property type: error_handling
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'audio_file_corrupted_req_error_handling_005',
-            'requirements_ref': 'req_error_handling_005'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_provide_retry_req_error_handling_005(self):
-        """
-        Property test for: THE VTT_System SHALL provide retry mechanism for failed transcriptions...
-        
-        Requirements reference: req_error_handling_005
-        Property type: error_handling
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_provide_retry_req_error_handling_005',
-            'requirements_ref': 'req_error_handling_005'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_recover_gracefully_req_error_handling_005(self):
-        """
-        Property test for: THE VTT_System SHALL recover gracefully from memory exhaustion...
-        
-        Requirements reference: req_error_handling_005
-        Property type: error_handling
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_recover_gracefully_req_error_handling_005',
-            'requirements_ref': 'req_error_handling_005'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
@@ -1,161 +0,0 @@
-"""
-Generated property tests for invariant properties.
-
-This file contains property-based tests generated from acceptance criteria.
-"""
-
-import pytest
-from hypothesis import given, strategies as st
-import time
-from typing import Any
-
-# Import VTT modernization components
-from whisper.modernization.models.property_models import PropertyTestResult
-from whisper.modernization.core.property_testing import PropertyTestFramework
-
-
-class TestInvariantProperties:
-    """Test class for invariant properties."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_framework = PropertyTestFramework()
-    
-
-    def test_vtt_system_accept_wav_req_transcription_001(self):
-        """
-        Property test for: THE VTT_System SHALL accept WAV, MP3, FLAC, and M4A audio formats...
-        
-        Requirements reference: req_transcription_001
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_accept_wav_req_transcription_001',
-            'requirements_ref': 'req_transcription_001'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_complete_transcription_req_transcription_001(self):
-        """
-        Property test for: THE VTT_System SHALL complete transcription within 2x the audio duration...
-        
-        Requirements reference: req_transcription_001
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_complete_transcription_req_transcription_001',
-            'requirements_ref': 'req_transcription_001'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_preserve_audio_req_transcription_001(self):
-        """
-        Property test for: THE VTT_System SHALL preserve audio metadata during processing...
-        
-        Requirements reference: req_transcription_001
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_preserve_audio_req_transcription_001',
-            'requirements_ref': 'req_transcription_001'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_when_primary_transcription_req_fallback_002(self):
-        """
-        Property test for: WHEN primary transcription engine fails, THE VTT_System SHALL automatically switch to secondary engi...
-        
-        Requirements reference: req_fallback_002
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'when_primary_transcription_req_fallback_002',
-            'requirements_ref': 'req_fallback_002'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_complete_fallback_req_fallback_002(self):
-        """
-        Property test for: THE VTT_System SHALL complete fallback transition within 5 seconds...
-        
-        Requirements reference: req_fallback_002
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_complete_fallback_req_fallback_002',
-            'requirements_ref': 'req_fallback_002'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_log_all_req_fallback_002(self):
-        """
-        Property test for: THE VTT_System SHALL log all fallback events with timestamp and reason...
-        
-        Requirements reference: req_fallback_002
-        Property type: invariant
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_log_all_req_fallback_002',
-            'requirements_ref': 'req_fallback_002'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
@@ -1,92 +0,0 @@
-"""
-Generated property tests for performance properties.
-
-This file contains property-based tests generated from acceptance criteria.
-"""
-
-import pytest
-from hypothesis import given, strategies as st
-import time
-from typing import Any
-
-# Import VTT modernization components
-from whisper.modernization.models.property_models import PropertyTestResult
-from whisper.modernization.core.property_testing import PropertyTestFramework
-
-
-class TestPerformanceProperties:
-    """Test class for performance properties."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_framework = PropertyTestFramework()
-    
-
-    def test_vtt_system_process_minute_req_performance_004(self):
-        """
-        Property test for: THE VTT_System SHALL process 1-minute audio in less than 30 seconds on CPU...
-        
-        Requirements reference: req_performance_004
-        Property type: performance
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_process_minute_req_performance_004',
-            'requirements_ref': 'req_performance_004'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_use_less_req_performance_004(self):
-        """
-        Property test for: THE VTT_System SHALL use less than 2GB RAM during transcription...
-        
-        Requirements reference: req_performance_004
-        Property type: performance
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_use_less_req_performance_004',
-            'requirements_ref': 'req_performance_004'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_cache_frequently_req_performance_004(self):
-        """
-        Property test for: THE VTT_System SHALL cache frequently used models to reduce loading time...
-        
-        Requirements reference: req_performance_004
-        Property type: performance
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_cache_frequently_req_performance_004',
-            'requirements_ref': 'req_performance_004'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
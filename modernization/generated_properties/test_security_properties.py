@@ -1,115 +0,0 @@
-"""
-Generated property tests for security properties.
-
-This file contains property-based tests generated from acceptance criteria.
-"""
-
-import pytest
-from hypothesis import given, strategies as st
-import time
-from typing import Any
-
-# Import VTT modernization components
-from whisper.modernization.models.property_models import PropertyTestResult
-from whisper.modernization.core.property_testing import PropertyTestFramework
-
-
-class TestSecurityProperties:
-    """Test class for security properties."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_framework = PropertyTestFramework()
-    
-
-    def test_vtt_system_encrypt_all_req_security_003(self):
-        """
-        Property test for: THE VTT_System SHALL encrypt all temporary audio files using AES-256...
-        
-        Requirements reference: req_security_003
-        Property type: security
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_encrypt_all_req_security_003',
-            'requirements_ref': 'req_security_003'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_delete_temporary_req_security_003(self):
-        """
-        Property test for: THE VTT_System SHALL delete temporary files within 60 seconds of processing completion...
-        
-        Requirements reference: req_security_003
-        Property type: security
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_delete_temporary_req_security_003',
-            'requirements_ref': 'req_security_003'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_never_transmit_req_security_003(self):
-        """
-        Property test for: THE VTT_System SHALL never transmit audio data to external servers...
-        
-        Requirements reference: req_security_003
-        Property type: security
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_never_transmit_req_security_003',
-            'requirements_ref': 'req_security_003'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
-
-    def test_vtt_system_audit_all_req_security_003(self):
-        """
-        Property test for: THE VTT_System SHALL audit all file access operations...
-        
-        Requirements reference: req_security_003
-        Property type: security
-        """
-        # TODO: Implement actual test logic
-        # This is a placeholder generated from acceptance criteria
-        
-        # Test context
-        context = {
-            'property_name': 'vtt_system_audit_all_req_security_003',
-            'requirements_ref': 'req_security_003'
-        }
-        
-        # Execute property test
-        result = prop.execute(context)
-        
-        # Assert test passed
-        assert result.success, f"Property test failed: {result.error_message}"
-    
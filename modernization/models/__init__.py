@@ -5,8 +5,18 @@ This module contains data models and type definitions used throughout
 the modernization infrastructure.
 """
 
-from .audio_models import EnhancedAudioData, ProcessingContext, TranscriptionResult
-from .property_models import TranscriptionProperty, PropertyType
+import importlib
+
+# Public names and the submodule defining each; submodules are imported on
+# first attribute access (PEP 562), so e.g. PropertyType does not pull in
+# the numpy-backed audio models
+_LAZY = {
+    'EnhancedAudioData': 'audio_models',
+    'ProcessingContext': 'audio_models',
+    'TranscriptionResult': 'audio_models',
+    'TranscriptionProperty': 'property_models',
+    'PropertyType': 'property_models',
+}
 
 __all__ = [
     'EnhancedAudioData',
@@ -14,4 +24,17 @@ __all__ = [
     'TranscriptionResult',
     'TranscriptionProperty',
     'PropertyType'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,12 +6,19 @@ for the modernized VTT system.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union
+import math
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 import time
 
+try:
+    from scipy import signal as scipy_signal
+except ImportError:
+    # Optional dependency, resampling falls back to linear interpolation otherwise
+    scipy_signal = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,6 +227,14 @@ class EnhancedAudioData:
     channels: int
     metadata: AudioMetadata
     processing_context: ProcessingContext
+    # (samples, rms, peak) from the last level measurement, see _get_levels
+    _level_cache: Optional[Tuple[np.ndarray, float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (samples, all finite) from the last finiteness scan, see _samples_finite
+    _finite_cache: Optional[Tuple[np.ndarray, bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate audio data after initialization."""
@@ -236,7 +251,7 @@ class EnhancedAudioData:
             errors.append("EnhancedAudioData.samples must be numpy array")
         elif self.samples.size == 0:
             errors.append("EnhancedAudioData.samples cannot be empty")
-        elif not np.isfinite(self.samples).all():
+        elif not self._samples_finite():
             errors.append("EnhancedAudioData.samples contains non-finite values")
         
         # Validate sample rate
@@ -266,6 +281,17 @@ class EnhancedAudioData:
         
         return errors
     
+    def _samples_finite(self) -> bool:
+        """
+        Check that all samples are finite, scanning each samples array once.
+        
+        Like the level cache, in-place edits of the samples are not detected.
+        """
+        cache = self._finite_cache
+        if cache is None or cache[0] is not self.samples:
+            cache = self._finite_cache = (self.samples, bool(np.isfinite(self.samples).all()))
+        return cache[1]
+    
     def get_duration(self) -> float:
         """Get audio duration in seconds."""
         if isinstance(self.samples, np.ndarray) and self.samples.size > 0:
@@ -275,12 +301,34 @@ class EnhancedAudioData:
                 return self.samples.shape[0] / self.sample_rate
         return 0.0
     
+    def _get_levels(self) -> Tuple[float, float]:
+        """
+        Get (RMS, peak) levels of audio, measured once per samples array.
+        
+        Levels are reductions over a flat view of the samples, so no
+        temporary copy of the audio is allocated. In-place edits of the
+        samples are not detected; assign a new array to measure again.
+        """
+        cache = self._level_cache
+        if cache is not None and cache[0] is self.samples:
+            return cache[1], cache[2]
+        
+        if not isinstance(self.samples, np.ndarray) or self.samples.size == 0:
+            rms = peak = 0.0
+        else:
+            flat = self.samples.reshape(-1)
+            if not np.issubdtype(flat.dtype, np.floating):
+                # Integer samples would overflow in the sum of squares
+                flat = flat.astype(np.float64)
+            rms = float(np.sqrt(np.dot(flat, flat) / flat.size))
+            peak = max(float(flat.max()), -float(flat.min()))
+        
+        self._level_cache = (self.samples, rms, peak)
+        return rms, peak
+    
     def get_rms_level(self) -> float:
         """Get RMS level of audio."""
-        if not isinstance(self.samples, np.ndarray) or self.samples.size == 0:
-            return 0.0
-        
-        return float(np.sqrt(np.mean(self.samples ** 2)))
+        return self._get_levels()[0]
     
     def is_silent(self, threshold: float = 0.001) -> bool:
         """Check if audio is silent."""
@@ -288,10 +336,7 @@ class EnhancedAudioData:
     
     def get_peak_level(self) -> float:
         """Get peak level of audio."""
-        if not isinstance(self.samples, np.ndarray) or self.samples.size == 0:
-            return 0.0
-        
-        return float(np.max(np.abs(self.samples)))
+        return self._get_levels()[1]
     
     def is_clipped(self, threshold: float = 0.99) -> bool:
         """Check if audio is clipped."""
@@ -331,25 +376,30 @@ class EnhancedAudioData:
         if self.sample_rate == target_sample_rate:
             return self
         
-        # Simple resampling (in production, would use proper resampling)
-        ratio = target_sample_rate / self.sample_rate
+        integer_rates = (float(self.sample_rate).is_integer()
+                         and float(target_sample_rate).is_integer())
         
-        if self.channels == 1:
-            new_length = int(len(self.samples) * ratio)
-            resampled = np.interp(
-                np.linspace(0, len(self.samples) - 1, new_length),
-                np.arange(len(self.samples)),
-                self.samples
+        if scipy_signal is not None and integer_rates:
+            # Polyphase FIR over the reduced integer ratio, all channels in one pass
+            source_rate, target_rate = int(self.sample_rate), int(target_sample_rate)
+            divisor = math.gcd(target_rate, source_rate)
+            resampled = scipy_signal.resample_poly(
+                self.samples, target_rate // divisor, source_rate // divisor, axis=0
             )
         else:
+            # Linear interpolation (also for non-integer rates), the sample
+            # positions are shared by all channels
+            ratio = target_sample_rate / self.sample_rate
             new_length = int(self.samples.shape[0] * ratio)
-            resampled = np.zeros((new_length, self.channels))
-            for ch in range(self.channels):
-                resampled[:, ch] = np.interp(
-                    np.linspace(0, self.samples.shape[0] - 1, new_length),
-                    np.arange(self.samples.shape[0]),
-                    self.samples[:, ch]
-                )
+            positions = np.linspace(0, self.samples.shape[0] - 1, new_length)
+            indices = np.arange(self.samples.shape[0])
+            
+            if self.channels == 1:
+                resampled = np.interp(positions, indices, self.samples)
+            else:
+                resampled = np.zeros((new_length, self.channels))
+                for ch in range(self.channels):
+                    resampled[:, ch] = np.interp(positions, indices, self.samples[:, ch])
         
         # Update metadata
         new_duration = self.metadata.duration * (target_sample_rate / self.sample_rate)
@@ -366,7 +416,7 @@ class EnhancedAudioData:
         )
         
         return EnhancedAudioData(
-            samples=resampled.astype(self.samples.dtype),
+            samples=resampled.astype(self.samples.dtype, copy=False),
             sample_rate=target_sample_rate,
             channels=self.channels,
             metadata=new_metadata,
@@ -8,11 +8,15 @@ property-based testing of VTT components.
 import logging
 from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
 import time
 
 logger = logging.getLogger(__name__)
 
+# Number of description characters kept by TranscriptionProperty.short_description
+_SHORT_DESCRIPTION_LENGTH = 80
+
 
 class PropertyType(Enum):
     """Types of properties for testing."""
@@ -226,6 +230,11 @@ class TranscriptionProperty:
         """Check if property definition is valid."""
         return len(self.validate()) == 0
     
+    @cached_property
+    def short_description(self) -> str:
+        """Description truncated for listings, computed on first access."""
+        return self.description[:_SHORT_DESCRIPTION_LENGTH]
+    
     def can_run(self, available_properties: List[str]) -> bool:
         """
         Check if property can run based on dependencies.
@@ -357,6 +366,11 @@ class PropertySuite:
         """Get list of enabled properties."""
         return [prop for prop in self.properties if prop.enabled]
     
+    @property
+    def enabled_count(self) -> int:
+        """Number of enabled properties, counted without building a list."""
+        return sum(1 for prop in self.properties if prop.enabled)
+    
     def get_properties_by_priority(self, priority: int) -> List[TranscriptionProperty]:
         """Get properties by priority level."""
         return [prop for prop in self.properties if prop.priority == priority and prop.enabled]
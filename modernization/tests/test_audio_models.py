@@ -0,0 +1,133 @@
+"""
+Unit tests for the audio data models.
+
+Tests resampling, level measurement and validation of enhanced audio data
+for mono and multi-channel input.
+"""
+
+import pytest
+import numpy as np
+
+from ..models.audio_models import EnhancedAudioData
+
+
+class TestEnhancedAudioData:
+    """Test cases for EnhancedAudioData."""
+
+    @pytest.fixture
+    def stereo_audio(self, sample_audio_metadata, sample_processing_context):
+        """One second of stereo audio with a different tone per channel."""
+        t = np.arange(16000) / 16000
+        samples = np.column_stack([
+            0.5 * np.sin(2 * np.pi * 220.0 * t),
+            0.25 * np.sin(2 * np.pi * 330.0 * t)
+        ]).astype(np.float32)
+
+        return EnhancedAudioData(
+            samples=samples,
+            sample_rate=16000,
+            channels=2,
+            metadata=sample_audio_metadata,
+            processing_context=sample_processing_context
+        )
+
+    def test_resample_same_rate_returns_self(self, sample_enhanced_audio):
+        """Test that resampling to the current rate is a no-op."""
+        assert sample_enhanced_audio.resample(16000) is sample_enhanced_audio
+
+    @pytest.mark.parametrize("target_rate", [8000, 22050, 44100])
+    def test_resample_mono(self, sample_enhanced_audio, target_rate):
+        """Test that mono resampling scales length and duration and keeps dtype."""
+        resampled = sample_enhanced_audio.resample(target_rate)
+        expected_length = len(sample_enhanced_audio.samples) * target_rate / 16000
+
+        assert resampled.sample_rate == target_rate
+        assert resampled.samples.ndim == 1
+        assert abs(len(resampled.samples) - expected_length) <= 1
+        assert resampled.samples.dtype == np.float32
+        assert resampled.metadata.duration == pytest.approx(target_rate / 16000)
+        assert resampled.metadata.source == "test_resampled"
+
+    def test_resample_multi_channel(self, stereo_audio):
+        """Test that multi-channel resampling keeps channels independent."""
+        resampled = stereo_audio.resample(8000)
+
+        assert resampled.samples.shape[1] == 2
+        assert abs(resampled.samples.shape[0] - 8000) <= 1
+        assert resampled.samples.dtype == np.float32
+        assert resampled.validate() == []
+
+        # Channel levels survive resampling (tones are far below the new Nyquist rate)
+        peaks = np.abs(resampled.samples[100:-100]).max(axis=0)
+        assert peaks == pytest.approx([0.5, 0.25], abs=0.02)
+
+    def test_levels_match_direct_computation(self, stereo_audio):
+        """Test that RMS and peak levels match the elementwise definitions."""
+        samples = stereo_audio.samples
+
+        assert stereo_audio.get_rms_level() == pytest.approx(
+            float(np.sqrt(np.mean(samples.astype(np.float64) ** 2))), rel=1e-5)
+        assert stereo_audio.get_peak_level() == pytest.approx(float(np.max(np.abs(samples))))
+        assert not stereo_audio.is_silent()
+        assert not stereo_audio.is_clipped()
+
+    def test_levels_follow_sample_reassignment(self, sample_enhanced_audio):
+        """Test that cached levels are measured again for a new samples array."""
+        assert sample_enhanced_audio.get_peak_level() == pytest.approx(1.0, abs=1e-3)
+        assert sample_enhanced_audio.is_clipped()
+
+        sample_enhanced_audio.samples = np.full(100, -0.5, dtype=np.float32)
+
+        assert sample_enhanced_audio.get_rms_level() == pytest.approx(0.5)
+        assert sample_enhanced_audio.get_peak_level() == pytest.approx(0.5)
+        assert not sample_enhanced_audio.is_clipped()
+
+    def test_levels_of_integer_samples(self, sample_audio_metadata, sample_processing_context):
+        """Test that integer samples do not overflow when measuring levels."""
+        audio = EnhancedAudioData(
+            samples=np.array([-32768, 32767, -32768, 32767], dtype=np.int16),
+            sample_rate=16000,
+            channels=1,
+            metadata=sample_audio_metadata,
+            processing_context=sample_processing_context
+        )
+
+        assert audio.get_rms_level() == pytest.approx(32767.5, rel=1e-4)
+        assert audio.get_peak_level() == 32768.0
+
+    def test_revalidation_follows_samples_and_nested_changes(self, sample_enhanced_audio):
+        """Test that memoized validation still reports new samples and nested edits."""
+        assert sample_enhanced_audio.validate() == []
+        assert sample_enhanced_audio.validate() == []
+
+        samples = sample_enhanced_audio.samples.copy()
+        samples[10] = np.nan
+        sample_enhanced_audio.samples = samples
+        assert sample_enhanced_audio.validate() == [
+            "EnhancedAudioData.samples contains non-finite values"
+        ]
+
+        sample_enhanced_audio.samples = np.zeros(100, dtype=np.float32)
+        sample_enhanced_audio.metadata.duration = -1.0
+        assert sample_enhanced_audio.validate() == ["AudioMetadata.duration must be positive"]
+
+    @pytest.mark.parametrize("source_rate, target_rate", [
+        (16000.0, 8000),
+        (16000, 8000.0),
+        (16000, 11025.5),
+    ])
+    def test_resample_float_rates(self, sample_audio_metadata, sample_processing_context,
+                                  source_rate, target_rate):
+        """Test that float sample rates are accepted by resampling."""
+        audio = EnhancedAudioData(
+            samples=np.zeros(16000, dtype=np.float32),
+            sample_rate=source_rate,
+            channels=1,
+            metadata=sample_audio_metadata,
+            processing_context=sample_processing_context
+        )
+
+        resampled = audio.resample(target_rate)
+
+        assert abs(len(resampled.samples) - 16000 * target_rate / source_rate) <= 1
+        assert resampled.sample_rate == target_rate
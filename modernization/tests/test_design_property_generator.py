@@ -594,6 +594,30 @@ class TestDesignPropertyGenerator:
                 assert all(path.exists() for path in generated_files)
                 assert all(path.suffix == '.py' for path in generated_files)
     
+    def test_parallel_generation_matches_sequential(self, generator, sample_requirements):
+        """Test that thread-pool generation keeps the sequential property order."""
+        parallel_generator = DesignPropertyGenerator({'parallel_generation': True})
+        
+        sequential = generator.generate_properties_from_requirements(sample_requirements)
+        parallel = parallel_generator.generate_properties_from_requirements(sample_requirements)
+        
+        assert ([prop.get_metadata() for prop in parallel.properties]
+                == [prop.get_metadata() for prop in sequential.properties])
+    
+    def test_export_all_matches_separate_exports(self, generator, sample_requirements):
+        """Test that the fused export writes the same artifacts as the separate calls."""
+        suite = generator.generate_properties_from_requirements(sample_requirements)
+        
+        with tempfile.TemporaryDirectory() as fused_dir, tempfile.TemporaryDirectory() as separate_dir:
+            success, fused_files = generator.export_all(suite, Path(fused_dir))
+            assert generator.export_property_suite(suite, Path(separate_dir) / "property_suite.json")
+            separate_files = generator.generate_test_code_files(suite, Path(separate_dir))
+            
+            assert success
+            assert [path.name for path in fused_files] == [path.name for path in separate_files]
+            for name in ["property_suite.json"] + [path.name for path in separate_files]:
+                assert (Path(fused_dir) / name).read_text() == (Path(separate_dir) / name).read_text()
+    
     def test_extract_criteria_from_requirements(self, generator, sample_requirements):
         """Test criteria extraction from requirements."""
         criteria_list = generator._extract_criteria_from_requirements(sample_requirements)
@@ -667,7 +691,7 @@ class TestDesignPropertyGenerator:
         prop_type = generator._map_to_property_type(default_mapping)
         assert prop_type == PropertyType.INVARIANT
     
-    def test_generate_test_file_content(self, generator):
+    def test_generate_test_module_content(self, generator):
         """Test test file content generation."""
         def mock_test_function(context):
             return True
@@ -691,14 +715,17 @@ class TestDesignPropertyGenerator:
             )
         ]
         
-        content = generator._generate_test_file_content(properties, "invariant")
+        content = generator._generate_test_module_content({"invariant": properties})
         
         assert isinstance(content, str)
         assert len(content) > 0
         assert "import pytest" in content
-        assert "TestInvariantProperties" in content
-        assert "test_test_property_1" in content
-        assert "test_test_property_2" in content
+        assert "@pytest.mark.skip(" in content
+        assert "def test_property(prop_type, prop_name, req_ref):" in content
+        assert "CASES_BY_TYPE" in content
+        assert "'invariant': [" in content
+        assert "'test_property_1'" in content
+        assert "'test_property_2'" in content
         assert "req_001" in content
         assert "req_002" in content
 
@@ -5,6 +5,8 @@ Tests comprehensive EARS (Easy Approach to Requirements Syntax) pattern
 validation including all pattern types and edge cases.
 """
 
+import time
+
 import pytest
 from ..core.spec_compliance import SpecComplianceModule, EARSPattern
 
@@ -436,4 +438,31 @@ class TestEARSPatternEdgeCases:
         
         for requirement in path_requirements:
             result = spec_module.ensure_ears_compliance(requirement)
-            assert result is True
\ No newline at end of file
+            assert result is True
+    
+    def test_triggers_containing_commas(self, spec_module):
+        """Test that conditional triggers may themselves contain commas."""
+        requirements = [
+            ("WHEN user stops, pauses, or cancels, THE system SHALL save state", EARSPattern.EVENT_DRIVEN),
+            ("IF disk is full, read-only, or missing, THEN THE system SHALL warn", EARSPattern.UNWANTED_BEHAVIOR),
+            ("WHILE recording, streaming, THE system SHALL show levels", EARSPattern.STATE_DRIVEN),
+        ]
+        
+        for requirement, expected_pattern in requirements:
+            assert spec_module._detect_ears_pattern(requirement) == expected_pattern
+    
+    def test_adversarial_comma_heavy_input(self, spec_module):
+        """Test that comma-heavy text without a SHALL clause is rejected without backtracking blow-up."""
+        adversarial_requirements = [
+            "WHEN " + "a," * 20000,
+            "IF " + ", THE x" * 5000,
+            "WHILE " + " ," * 20000 + " THE " + "x" * 20000,
+        ]
+        
+        start_time = time.perf_counter()
+        for requirement in adversarial_requirements:
+            assert spec_module.ensure_ears_compliance(requirement) is False
+            assert spec_module._detect_ears_pattern(requirement) == EARSPattern.INVALID
+        
+        # Generous bound: only catastrophic (super-linear) backtracking comes near it
+        assert time.perf_counter() - start_time < 10.0
@@ -0,0 +1,242 @@
+"""
+Unit tests for the Enhanced Fallback Manager.
+
+Tests engine registration, fallback ordering and the engine metrics
+bookkeeping performed on every transcription attempt.
+"""
+
+import asyncio
+import time
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from ..enhanced.fallback_manager import (
+    EnhancedFallbackManager, TranscriptionEngine, TranscriptionResult,
+    AudioData, EngineStatus
+)
+
+
+class TestEnhancedFallbackManager:
+    """Test cases for the Enhanced Fallback Manager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create an EnhancedFallbackManager instance for testing."""
+        return EnhancedFallbackManager()
+
+    @pytest.fixture
+    def audio(self):
+        """Two seconds of silent audio."""
+        return AudioData(samples=np.zeros(32000, dtype=np.float32), sample_rate=16000)
+
+    def test_fallback_to_next_engine(self, manager, audio):
+        """Test that a failing engine falls back to the next priority."""
+        def failing_engine(samples, sample_rate):
+            raise RuntimeError("engine down")
+
+        manager.register_engine(TranscriptionEngine("primary", 0, failing_engine), priority=1)
+        manager.register_engine(
+            TranscriptionEngine("backup", 0, lambda samples, sample_rate: "backup transcription"),
+            priority=2
+        )
+
+        result = manager.attempt_transcription(audio)
+
+        assert result.success
+        assert result.engine_used == "backup"
+        assert manager.get_fallback_history()[-1]['engine_name'] == "primary"
+
+    def test_running_averages_match_window_mean(self, manager):
+        """Test that running averages track the mean of the bounded windows."""
+        manager.register_engine(TranscriptionEngine("engine", 0, lambda samples, sample_rate: ""), priority=1)
+        metrics = manager.metrics["engine"]
+        window = metrics.recent_latencies.maxlen
+
+        for i in range(window + 25):
+            result = TranscriptionResult(
+                text="text", confidence=0.9, engine_used="engine",
+                processing_time=0.01 * (i % 7), quality_score=0.5 + 0.001 * i
+            )
+            manager._update_engine_metrics(metrics, result, True)
+
+        assert len(metrics.recent_latencies) == window
+        assert metrics.average_latency == pytest.approx(
+            sum(metrics.recent_latencies) / window)
+        assert metrics.average_quality == pytest.approx(
+            sum(metrics.recent_qualities) / window)
+        assert metrics.status == EngineStatus.DEGRADED
+
+    def test_available_engines_cache_invalidation(self, manager):
+        """Test that the cached engine order follows registration, status and enabled changes."""
+        fast = TranscriptionEngine("fast", 0, lambda samples, sample_rate: "fast")
+        slow = TranscriptionEngine("slow", 0, lambda samples, sample_rate: "slow")
+        manager.register_engine(slow, priority=2)
+        manager.register_engine(fast, priority=1)
+
+        assert [e.name for e in manager._get_available_engines()] == ["fast", "slow"]
+
+        manager.trigger_fallback("fast", "engine crashed")
+        assert [e.name for e in manager._get_available_engines()] == ["slow"]
+
+        slow.enabled = False
+        assert manager._get_available_engines() == []
+
+        manager.unregister_engine("fast")
+        slow.enabled = True
+        assert [e.name for e in manager._get_available_engines()] == ["slow"]
+
+    def test_concurrent_transcriptions_keep_consistent_metrics(self, manager, audio):
+        """Test that concurrent transcriptions account every request exactly once."""
+        manager.register_engine(
+            TranscriptionEngine("engine", 0, lambda samples, sample_rate: "concurrent transcription"),
+            priority=1
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: manager.attempt_transcription(audio), range(200)))
+
+        metrics = manager.metrics["engine"]
+        assert all(result.success for result in results)
+        assert metrics.total_requests == metrics.successful_requests == 200
+        assert metrics.average_latency == pytest.approx(
+            sum(metrics.recent_latencies) / len(metrics.recent_latencies))
+
+    def test_fallback_history_is_bounded(self, manager):
+        """Test that fallback history keeps only the most recent events."""
+        manager.register_engine(TranscriptionEngine("engine", 0, lambda samples, sample_rate: ""), priority=1)
+
+        for i in range(1500):
+            manager.trigger_fallback("engine", f"timeout {i}")
+
+        history = manager.get_fallback_history()
+        assert len(history) == 1000
+        assert history[-1]['details'] == "timeout 1499"
+        assert manager.get_fallback_history(limit=10)[0]['details'] == "timeout 1490"
+
+    def test_invalid_sample_rate_fails_alike_in_single_and_batch(self, manager):
+        """Test that a non-positive sample rate fails without calling any engine."""
+        calls = []
+        manager.register_engine(
+            TranscriptionEngine("engine", 0, lambda samples, sample_rate: calls.append(sample_rate) or "text"),
+            priority=1
+        )
+        bad = AudioData(samples=np.zeros(1600, dtype=np.float32), sample_rate=0)
+        good = AudioData(samples=np.zeros(1600, dtype=np.float32), sample_rate=16000)
+
+        single = manager.attempt_transcription(bad)
+        batch = manager.attempt_transcription_batch([bad, good])
+
+        assert single == batch[0]
+        assert not single.success
+        assert single.error_message == "Invalid sample rate: 0"
+        assert batch[1].success
+        assert calls == [16000]
+        assert manager.get_engine_metrics("engine")["engine"].failed_requests == 0
+
+    def test_fallback_history_reads_during_concurrent_recording(self, manager):
+        """Test that history snapshots are safe while other threads record events."""
+        manager.register_engine(TranscriptionEngine("engine", 0, lambda samples, sample_rate: ""), priority=1)
+
+        def record(worker):
+            for i in range(500):
+                manager.trigger_fallback("engine", f"worker {worker} event {i}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            writers = [executor.submit(record, worker) for worker in range(3)]
+            while not all(writer.done() for writer in writers):
+                assert len(manager.get_fallback_history(limit=5)) <= 5
+            for writer in writers:
+                writer.result()
+
+        assert len(manager.get_fallback_history()) == 1000
+
+    def test_batch_transcription_matches_single_calls(self, manager):
+        """Test that batch transcription returns per-chunk results in input order."""
+        manager.register_engine(
+            TranscriptionEngine("engine", 0, lambda samples, sample_rate: "x" * (len(samples) // 1000)),
+            priority=1
+        )
+        audios = [
+            AudioData(samples=np.zeros(n, dtype=np.float32), sample_rate=16000)
+            for n in (4000, 32000, 64000, 8000)
+        ]
+
+        batch = manager.attempt_transcription_batch(audios)
+        single = [manager.attempt_transcription(audio) for audio in audios]
+
+        assert [r.text for r in batch] == [r.text for r in single]
+        assert [r.success for r in batch] == [r.success for r in single]
+        assert [r.quality_score for r in batch] == [r.quality_score for r in single]
+        assert manager.attempt_transcription_batch([]) == []
+
+    def test_async_transcription_falls_back(self, manager, audio):
+        """Test that async transcription awaits engines and falls back like the sync path."""
+        def failing_engine(samples, sample_rate):
+            raise RuntimeError("engine down")
+
+        manager.register_engine(TranscriptionEngine("primary", 0, failing_engine), priority=1)
+        manager.register_engine(
+            TranscriptionEngine("backup", 0, lambda samples, sample_rate: "backup transcription"),
+            priority=2
+        )
+
+        result = asyncio.run(manager.attempt_transcription_async(audio))
+
+        assert result.success
+        assert result.engine_used == "backup"
+        assert manager.metrics["backup"].successful_requests == 1
+        assert manager.get_fallback_history()[-1]['engine_name'] == "primary"
+
+    def test_system_metrics_cached_within_ttl(self, manager):
+        """Test that health checks within the TTL reuse one system reading."""
+        first = manager.monitor_engine_health()
+        second = manager.monitor_engine_health()
+
+        assert (first.system_load, first.memory_usage) == (second.system_load, second.memory_usage)
+        assert 0.0 <= first.system_load <= 1.0
+        assert 0.0 <= first.memory_usage <= 1.0
+
+    @pytest.mark.parametrize("reason, expected", [
+        ("Performance dropped, also a timeout", "performance_degradation"),
+        ("Request TIMEOUT after 30s", "timeout"),
+        ("quality below threshold", "quality_threshold"),
+        ("segmentation fault", "engine_failure"),
+    ])
+    def test_trigger_fallback_reason_mapping(self, manager, reason, expected):
+        """Test that manual fallback reasons map to enums in keyword priority order."""
+        manager.register_engine(TranscriptionEngine("engine", 0, lambda samples, sample_rate: ""), priority=1)
+
+        assert manager.trigger_fallback("engine", reason)
+        assert manager.get_fallback_history(limit=1)[0]['reason'] == expected
+
+    def test_stop_monitoring_interrupts_wait(self):
+        """Test that stopping monitoring does not wait for the health check interval."""
+        manager = EnhancedFallbackManager({'health_check_interval': 60.0})
+        manager.start_monitoring()
+
+        start = time.perf_counter()
+        manager.stop_monitoring()
+
+        assert time.perf_counter() - start < 2.0
+        assert not manager._monitoring_thread.is_alive()
+
+    def test_available_engines_ordered_by_priority_then_health(self, manager):
+        """Test that equal-priority engines are ordered by health score."""
+        for name, priority in (("c", 2), ("a", 1), ("b", 2), ("d", 3)):
+            manager.register_engine(TranscriptionEngine(name, 0, lambda samples, sample_rate: name), priority)
+
+        # Unused engines tie on health, so registration order is kept
+        assert [e.name for e in manager._get_available_engines()] == ["a", "c", "b", "d"]
+
+        result = TranscriptionResult(
+            text="text", confidence=0.9, engine_used="c", processing_time=0.1, quality_score=0.9
+        )
+        manager._update_engine_metrics(manager.metrics["c"], result, True)
+        manager._update_engine_status("b", EngineStatus.DEGRADED)
+
+        assert [e.name for e in manager._get_available_engines()] == ["a", "b", "c", "d"]
+
+        manager.register_engine(manager.engines["a"], priority=4)
+        manager.unregister_engine("d")
+        assert [e.name for e in manager._get_available_engines()] == ["b", "c", "a"]
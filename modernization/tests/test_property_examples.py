@@ -12,7 +12,21 @@ from hypothesis.extra.numpy import arrays
 
 from ..models.audio_models import EnhancedAudioData, AudioMetadata, ProcessingContext
 from ..models.property_models import TranscriptionProperty, PropertyType, ValidationCriteria, ValidationCriteriaType
-from ..core.property_testing import PropertyTestFramework
+from ..core.property_testing import PropertyTestFramework, Serializer, _SIGNAL_POOL_SIZE
+
+
+class _EchoComponent:
+    """Minimal component satisfying the built-in transcription properties."""
+    
+    def transcribe(self, audio_data):
+        return ""
+    
+    def process_audio(self, audio_data):
+        return audio_data
+
+
+_parametrized_framework = PropertyTestFramework({'max_examples': 10})
+_parametrized_framework.define_transcription_properties()
 
 
 class TestAudioProcessingProperties:
@@ -345,4 +359,88 @@ class TestTranscriptionProperties:
         assert isinstance(result.property_name, str)
         assert isinstance(result.success, bool)
         assert result.execution_time >= 0
-        assert result.iterations_run >= 0
\ No newline at end of file
+        assert result.iterations_run >= 0
+
+
+class TestPropertyTestFramework:
+    """Tests for the property test framework configuration."""
+    
+    def test_framework_reuses_shared_settings_profile(self):
+        """Frameworks without overrides share one Hypothesis settings object."""
+        first = PropertyTestFramework()
+        second = PropertyTestFramework({'verbose': False})
+        
+        assert first.hypothesis_settings is second.hypothesis_settings
+        assert first.hypothesis_settings.max_examples == 100
+    
+    def test_framework_applies_settings_overrides(self):
+        """Explicit max_examples/deadline still override the shared profile."""
+        framework = PropertyTestFramework({'max_examples': 7, 'deadline': 500})
+        
+        assert framework.hypothesis_settings.max_examples == 7
+        assert framework.hypothesis_settings.deadline.total_seconds() == 0.5
+    
+    def test_signal_pool_is_bounded_and_draws_are_copies(self, audio_generators):
+        """Pooled sine signals are bounded and never handed out directly."""
+        first = audio_generators._create_audio_array(16000, 0.1, 1, 0.01)
+        first[:] = 0.0
+        second = audio_generators._create_audio_array(16000, 0.1, 1, 0.01)
+        
+        assert second.shape == (1600,)
+        assert np.any(second != 0.0), "Mutating a draw must not alter the pool"
+        
+        for step in range(1, 2 * _SIGNAL_POOL_SIZE):
+            audio_generators._create_audio_array(16000, step / 100, 2, 0.0)
+        
+        assert len(audio_generators._signal_pool) == _SIGNAL_POOL_SIZE
+    
+    def test_noisy_audio_replays_from_seed(self, audio_generators):
+        """Noise comes from the drawn seed, so Hypothesis can replay an example."""
+        first = audio_generators._create_audio_array(16000, 0.1, 2, 0.05, seed=1234)
+        again = audio_generators._create_audio_array(16000, 0.1, 2, 0.05, seed=1234)
+        other = audio_generators._create_audio_array(16000, 0.1, 2, 0.05, seed=4321)
+        
+        np.testing.assert_array_equal(first, again)
+        assert np.any(first != other)
+    
+    def test_noise_scratch_does_not_leak_into_draws(self, audio_generators):
+        """Reusing the noise scratch buffer leaves earlier draws unchanged."""
+        short = audio_generators._create_audio_array(16000, 0.1, 1, 0.05, seed=1)
+        expected = short.copy()
+        audio_generators._create_audio_array(16000, 0.2, 1, 0.05, seed=2)
+        audio_generators._create_audio_array(16000, 0.1, 1, 0.05, seed=3)
+        
+        np.testing.assert_array_equal(short, expected)
+        assert short.dtype == np.float32
+        assert audio_generators._noise_scratch.shape == (3200,)
+    
+    @pytest.mark.parametrize("prop", _parametrized_framework.property_params())
+    def test_property_runs_as_parametrized_case(self, prop):
+        """Each built-in property can run as its own pytest case."""
+        failure = _parametrized_framework.run_single_property(prop, _EchoComponent())
+        
+        assert failure is None, failure
+    
+    def test_run_property_tests_reports_all_properties(self):
+        """The serial runner executes every property with the requested iterations."""
+        framework = PropertyTestFramework()
+        framework.define_transcription_properties()
+        base_settings = framework.hypothesis_settings
+        
+        results = framework.run_property_tests(_EchoComponent(), iterations=5)
+        
+        assert results.total_tests == 4
+        assert results.passed_tests == 4, results.failures
+        assert framework.hypothesis_settings is base_settings
+    
+    def test_round_trip_validation_detects_lossy_serializer(self):
+        """Memoized round-trips still report serializers that lose data."""
+        class LossySerializer(Serializer):
+            def deserialize(self, data):
+                value = super().deserialize(data)
+                return value[:-1] if isinstance(value, str) and value else value
+        
+        framework = PropertyTestFramework({'max_examples': 50})
+        
+        assert framework.validate_round_trip_properties(Serializer())
+        assert not framework.validate_round_trip_properties(LossySerializer())
@@ -108,6 +108,23 @@ class TestSpecComplianceModule:
         
         assert not spec_module.ensure_ears_compliance(requirement)
     
+    def test_ears_validation_counts_duplicate_texts(self, spec_module):
+        """Test that duplicated requirement texts are each counted and reported."""
+        requirements = {
+            'req_1': {'text': 'THE VTT_System SHALL log all operations'},
+            'req_2': {'text': 'THE VTT_System SHALL log all operations'},
+            'req_3': {'text': 'The system should log things'},
+            'req_4': {'text': 'The system should log things'}
+        }
+        
+        result = spec_module._validate_ears_patterns(requirements)
+        
+        assert result['pattern_distribution'] == {EARSPattern.UBIQUITOUS: 2}
+        assert result['errors'] == [
+            "Requirement req_3 does not follow EARS patterns",
+            "Requirement req_4 does not follow EARS patterns"
+        ]
+    
     def test_incose_completeness_check(self, spec_module, sample_requirements):
         """Test INCOSE completeness quality rule."""
         result = spec_module._check_completeness(sample_requirements)
@@ -130,6 +147,20 @@ class TestSpecComplianceModule:
         assert result['is_valid']
         assert len(result['warnings']) == 0
     
+    def test_incose_consistency_check_conflicting_actions(self, spec_module):
+        """Test consistency check detecting opposite actions on one entity."""
+        requirements = {
+            'req_1': {'text': 'WHEN user presses hotkey, THE VTT_System SHALL start recording'},
+            'req_2': {'text': 'WHEN user presses hotkey, THE vtt_system SHALL stop recording'},
+            'req_3': {'text': 'THE Recorder SHALL enable noise reduction'}
+        }
+        
+        result = spec_module._check_consistency(requirements)
+        
+        assert not result['is_valid']
+        assert any('VTT_SYSTEM: start vs stop' in warning for warning in result['warnings'])
+        assert not any('RECORDER' in warning for warning in result['warnings'])
+    
     def test_incose_clarity_check(self, spec_module):
         """Test INCOSE clarity quality rule."""
         requirements_with_clarity_issues = {
@@ -145,6 +176,20 @@ class TestSpecComplianceModule:
         assert len(result['warnings']) > 0
         assert any('complex sentence' in warning for warning in result['warnings'])
     
+    def test_incose_clarity_check_pronouns_as_whole_words(self, spec_module):
+        """Test that ambiguous pronouns are matched as whole words only."""
+        requirements = {
+            'req_1': {'text': 'It SHALL inhibit output when they request this.'}
+        }
+        
+        warnings = spec_module._check_clarity(requirements)['warnings']
+        
+        assert warnings == [
+            "Requirement req_1 contains ambiguous pronoun: it",
+            "Requirement req_1 contains ambiguous pronoun: this",
+            "Requirement req_1 contains ambiguous pronoun: they",
+        ]
+    
     def test_generate_design_properties(self, spec_module, sample_requirements):
         """Test generation of design properties from requirements."""
         properties = spec_module.generate_design_properties(sample_requirements)
@@ -274,6 +319,21 @@ class TestSpecComplianceModule:
             assert '<title>Test Requirements</title>' in content
             assert '<h1>Test Requirements</h1>' in content
     
+    def test_export_html_escapes_document_text(self, spec_module, sample_requirements):
+        """Test that document text is escaped in HTML export."""
+        requirements_data = {
+            'title': 'Specs & <Notes>',
+            'glossary': {'<b>': 'Bold & loud'},
+            'requirements': sample_requirements
+        }
+        
+        document = spec_module.generate_requirements_document(requirements_data)
+        content = spec_module._export_to_html(document)
+        
+        assert '<title>Specs &amp; &lt;Notes&gt;</title>' in content
+        assert '<dt><strong>&lt;b&gt;</strong></dt><dd>Bold &amp; loud</dd>' in content
+        assert '<b>' not in content
+    
     def test_document_template_retrieval(self, spec_module):
         """Test document template retrieval."""
         template = spec_module._get_document_template('standard')
@@ -283,6 +343,17 @@ class TestSpecComplianceModule:
         assert 'introduction' in template.sections
         assert 'requirements' in template.sections
     
+    def test_templates_and_rules_built_lazily(self):
+        """Test that templates and rules are only built on first access."""
+        module = SpecComplianceModule()
+        
+        assert 'document_templates' not in vars(module)
+        assert 'incose_rules' not in vars(module)
+        
+        assert module._get_document_template('standard') is module.document_templates['standard']
+        assert len(module.incose_rules) == 6
+        assert 'incose_rules' in vars(module)
+    
     def test_user_story_format_validation(self, spec_module):
         """Test user story format validation."""
         valid_story = "As a user, I want to transcribe audio so that I can convert speech to text"
@@ -290,6 +361,8 @@ class TestSpecComplianceModule:
         
         assert spec_module._is_valid_user_story_format(valid_story)
         assert not spec_module._is_valid_user_story_format(invalid_story)
+        assert spec_module._is_valid_user_story_format("As an operator, I want logs, so that I can audit")
+        assert not spec_module._is_valid_user_story_format("So that I can audit, as a user I want logs")
     
     def test_ears_suggestions_generation(self, spec_module):
         """Test EARS pattern suggestions generation."""
@@ -300,6 +373,101 @@ class TestSpecComplianceModule:
         assert any('SHALL' in suggestion for suggestion in suggestions)
         assert any('EARS' in suggestion for suggestion in suggestions)
     
+    def test_validation_result_is_cached_by_content(self, spec_module, sample_requirements):
+        """Test that repeated validation of identical requirements is memoized."""
+        first = spec_module.validate_requirements(sample_requirements)
+        
+        with patch.object(spec_module, '_validate_ears_patterns') as ears_check:
+            second = spec_module.validate_requirements(dict(sample_requirements))
+            ears_check.assert_not_called()
+        
+        assert second == first
+        assert second is not first
+        
+        # Mutating a returned result must not leak into the cache
+        second.warnings.append("caller warning")
+        assert spec_module.validate_requirements(sample_requirements).warnings == first.warnings
+    
+    def test_validation_cache_detects_changed_content(self, spec_module, sample_requirements):
+        """Test that changed requirements are validated again."""
+        spec_module.validate_requirements(sample_requirements)
+        sample_requirements['req_3'] = {'text': 'The system should maybe do something'}
+        
+        result = spec_module.validate_requirements(sample_requirements)
+        
+        assert not result.is_valid
+    
+    def test_parallel_incose_validation_matches_sequential(self, spec_module, invalid_requirements):
+        """Test that thread-pool INCOSE validation aggregates in rule order."""
+        parallel_module = SpecComplianceModule({'parallel_incose_validation': True})
+        try:
+            parallel_result = parallel_module._validate_incose_rules(invalid_requirements)
+        finally:
+            parallel_module.close()
+        
+        assert parallel_result == spec_module._validate_incose_rules(invalid_requirements)
+        assert list(parallel_result['compliance']) == [rule.name for rule in spec_module.incose_rules]
+        
+        # Closing twice is harmless
+        parallel_module.close()
+    
+    def test_incose_validation_walks_requirements_once(self, spec_module, sample_requirements):
+        """Test that the per-requirement checkers share one pass during validation."""
+        with patch.object(spec_module, '_run_all_checks', wraps=spec_module._run_all_checks) as run_all:
+            result = spec_module._validate_incose_rules(sample_requirements)
+        
+        assert run_all.call_count == 1
+        assert set(result['compliance']) == {rule.name for rule in spec_module.incose_rules}
+        assert spec_module._requirement_checks_memo is None
+    
+    def test_single_check_runs_only_that_checker(self, spec_module, sample_requirements):
+        """Test that calling one checker directly does not run the other three."""
+        with patch.object(spec_module, '_clarity_issues') as clarity, \
+                patch.object(spec_module, '_traceability_issues') as traceability:
+            result = spec_module._check_verifiability(sample_requirements)
+        
+        assert set(result) == {'is_valid', 'warnings', 'suggestions'}
+        clarity.assert_not_called()
+        traceability.assert_not_called()
+    
+    def test_parallel_incose_validation_runs_checks_per_validator(self, invalid_requirements):
+        """Test that thread-pool validation skips the fused pass and runs each check once."""
+        parallel_module = SpecComplianceModule({'parallel_incose_validation': True})
+        try:
+            with patch.object(parallel_module, '_run_all_checks',
+                              wraps=parallel_module._run_all_checks) as run_all:
+                parallel_module._validate_incose_rules(invalid_requirements)
+        finally:
+            parallel_module.close()
+        
+        assert sorted(call.args[1] for call in run_all.call_args_list) == [
+            ('clarity',), ('feasibility',), ('traceability',), ('verifiability',)
+        ]
+    
+    def test_parallel_requirement_checks_match_sequential(self, spec_module, invalid_requirements, monkeypatch):
+        """Test that process-pool requirement checks merge in requirement order."""
+        monkeypatch.setattr('modernization.core.spec_compliance.PARALLEL_CHECK_MIN_REQUIREMENTS', 1)
+        parallel_module = SpecComplianceModule({
+            'parallel_requirement_checks': True,
+            'requirement_check_workers': 2
+        })
+        try:
+            parallel_result = parallel_module._validate_incose_rules(invalid_requirements)
+        finally:
+            parallel_module.close()
+        
+        assert parallel_result == spec_module._validate_incose_rules(invalid_requirements)
+    
+    def test_failing_checker_does_not_affect_others(self, spec_module):
+        """Test that an error in one checker is reported for that rule only."""
+        requirements = {'req_1': {'text': 42, 'rationale': 'r', 'source': 's'}}
+        
+        result = spec_module._validate_incose_rules(requirements)
+        
+        assert result['compliance']['Clarity'] is False
+        assert result['compliance']['Traceability'] is True
+        assert any('Error validating Clarity' in warning for warning in result['warnings'])
+    
     def test_error_handling_in_validation(self, spec_module):
         """Test error handling during validation."""
         # Test with malformed requirements data